@@ -0,0 +1,197 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import List
+from ecc import Banderwagon
+from ecc.bandersnatch.field_base import Fp
+from ecc.bandersnatch.twedards import BandersnatchAffinePoint, BandersnatchExtendedPoint, BandersnatchCachedPoint
+from ecc.banderwagon.fixed_base import FixedBaseTable
+from .crs import CRS
+from .constants import CRS_CONSTANTS
+
+# On-disk cache of the CRS, so that processes do not need to decompress
+# the basis points and rebuild the fixed base tables every time they start.
+#
+# Layout (integers are little endian):
+#
+#   magic               8 bytes
+#   basis hash          32 bytes, sha256 of the serialised basis points, see `crs_basis_hash`
+#   number of points    4 bytes
+#   window size         4 bytes, zero if the cache holds no fixed base tables
+#   points              number of points * 64 bytes, each point is x || y in affine form
+#   points hash         32 bytes, sha256 of the points section
+#
+# If the window size is not zero, this is followed by:
+#
+#   table hashes        number of points * 32 bytes, sha256 of each table
+#   tables              number of points * table size, each table is a list of affine points
+#
+# Tables are checked against their hash and decoded only when they are first used.
+MAGIC = b"VKLCRS01"
+HEADER_FORMAT = "<8s32sII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+HASH_SIZE = 32
+FIELD_ELEMENT_SIZE = 32
+AFFINE_POINT_SIZE = 2 * FIELD_ELEMENT_SIZE
+
+
+# The basis hash of the default CRS
+def crs_constants_hash() -> bytes:
+    hasher = hashlib.sha256()
+    for crs_hex in CRS_CONSTANTS:
+        hasher.update(bytes.fromhex(crs_hex))
+    return hasher.digest()
+
+
+# Identifies the basis of a CRS, for example one made with `CRS.generate_crs`
+def crs_basis_hash(points: List[Banderwagon]) -> bytes:
+    hasher = hashlib.sha256()
+    for point_bytes in Banderwagon.batch_to_bytes(points):
+        hasher.update(point_bytes)
+    return hasher.digest()
+
+
+def _points_to_bytes(points: List[BandersnatchExtendedPoint]) -> bytes:
+    result = bytearray()
+    for affine in BandersnatchExtendedPoint.batch_to_affine(points):
+        result += affine.x.to_bytes()
+        result += affine.y.to_bytes()
+    return bytes(result)
+
+
+def _points_from_bytes(buffer) -> List[BandersnatchExtendedPoint]:
+    points = []
+    for offset in range(0, len(buffer), AFFINE_POINT_SIZE):
+        x = int.from_bytes(
+            buffer[offset:offset + FIELD_ELEMENT_SIZE], byteorder='little')
+        y = int.from_bytes(
+            buffer[offset + FIELD_ELEMENT_SIZE:offset + AFFINE_POINT_SIZE], byteorder='little')
+        # Will error if the point is not on the curve
+        affine_point = BandersnatchAffinePoint(Fp(x), Fp(y))
+        points.append(BandersnatchExtendedPoint(affine_point))
+    return points
+
+
+# Returns None if a point is not on the curve or is not in the banderwagon subgroup
+def _basis_from_bytes(buffer) -> List[Banderwagon]:
+    try:
+        points = _points_from_bytes(buffer)
+    except Exception:
+        return None
+
+    # The points are affine, so x is the affine x co-ordinate
+    if any(Banderwagon.subgroup_check(point.x) != 1 for point in points):
+        return None
+    return [Banderwagon(None, point) for point in points]
+
+
+def _table_to_bytes(table: FixedBaseTable) -> bytes:
+    # Table entries are already affine
+    result = bytearray()
+    for row in table.table:
+        for entry in row:
+            result += entry.x.to_bytes()
+            result += entry.y.to_bytes()
+    return bytes(result)
+
+
+def _table_from_bytes(buffer, window_size) -> FixedBaseTable:
+    entries = [BandersnatchCachedPoint.from_normalized(point)
+               for point in _points_from_bytes(buffer)]
+    num_digits = (1 << window_size) - 1
+    rows = [entries[i:i + num_digits]
+            for i in range(0, len(entries), num_digits)]
+    return FixedBaseTable(None, window_size, precomputed_table=rows)
+
+
+# Writes the CRS and, if `window_size` is not None, a fixed base table for every basis point.
+# The file is written to a temporary path first, so concurrent readers never see a partial file.
+def save_crs_cache(crs: CRS, path, window_size=None):
+    basis = crs.BASIS_G
+    num_points = len(basis)
+
+    header = struct.pack(HEADER_FORMAT, MAGIC, crs_basis_hash(basis),
+                         num_points, window_size or 0)
+    points = _points_to_bytes([point.point for point in basis])
+
+    table_hashes = bytearray()
+    tables = []
+    if window_size is not None:
+        for index, point in enumerate(basis):
+            table = crs.fixed_base_tables.get(index)
+            if table is None or table.window_size != window_size:
+                table = FixedBaseTable(point, window_size)
+            table_bytes = _table_to_bytes(table)
+            table_hashes += hashlib.sha256(table_bytes).digest()
+            tables.append(table_bytes)
+
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(points)
+        f.write(hashlib.sha256(points).digest())
+        f.write(table_hashes)
+        for table_bytes in tables:
+            f.write(table_bytes)
+    os.replace(tmp_path, path)
+
+
+# Returns None if the file does not exist or is malformed.
+# If `basis_hash` is given, None is also returned when the file holds a different basis, see `crs_basis_hash`
+def load_crs_cache(path, max_fixed_base_tables=None, basis_hash=None):
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < HEADER_SIZE:
+        return None
+
+    magic, file_basis_hash, num_points, window_size = struct.unpack_from(
+        HEADER_FORMAT, buffer, 0)
+    if magic != MAGIC:
+        return None
+    if basis_hash is not None and file_basis_hash != basis_hash:
+        return None
+
+    points_start = HEADER_SIZE
+    points_end = points_start + num_points * AFFINE_POINT_SIZE
+    tables_start = points_end + HASH_SIZE
+    table_size = 0
+    if window_size != 0:
+        table_size = FixedBaseTable.num_entries(
+            window_size) * AFFINE_POINT_SIZE
+        tables_start += num_points * HASH_SIZE
+    if len(buffer) != tables_start + num_points * table_size:
+        return None
+
+    points_bytes = buffer[points_start:points_end]
+    if hashlib.sha256(points_bytes).digest() != buffer[points_end:points_end + HASH_SIZE]:
+        return None
+
+    basis = _basis_from_bytes(points_bytes)
+    if basis is None:
+        return None
+    # The header hash is checked against the decoded points, not only against `basis_hash`
+    if crs_basis_hash(basis) != file_basis_hash:
+        return None
+
+    if window_size == 0:
+        return CRS(basis)
+
+    crs = CRS(basis, window_size, max_fixed_base_tables)
+
+    def load_table(index):
+        hash_offset = points_end + HASH_SIZE + index * HASH_SIZE
+        offset = tables_start + index * table_size
+        table_bytes = buffer[offset:offset + table_size]
+        if hashlib.sha256(table_bytes).digest() != buffer[hash_offset:hash_offset + HASH_SIZE]:
+            # Fall back to building the table
+            return None
+
+        return _table_from_bytes(table_bytes, window_size)
+
+    crs.fixed_base_table_loader = load_table
+    return crs
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from crs import CRS, get_crs
+import hashlib
+from ecc import Banderwagon, Fr
+from ecc.bandersnatch.field_base import Fp
+from ecc.bandersnatch.twedards import A, D, BandersnatchAffinePoint, BandersnatchExtendedPoint
+from ecc.banderwagon.fixed_base import FixedBaseTable
+from .cache import load_crs_cache, save_crs_cache, _points_to_bytes, _table_from_bytes, _table_to_bytes, crs_basis_hash, HEADER_SIZE, MAGIC
+
+
+class TestCRSCache(unittest.TestCase):
+
+    def test_cache_round_trip(self):
+        """
+            Test that a CRS loaded from the cache has the same basis points as the hardcoded CRS
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crs.bin")
+
+            self.assertIsNone(load_crs_cache(path))
+
+            crs = CRS.default(cache_path=path)
+            self.assertTrue(os.path.exists(path))
+
+            loaded = load_crs_cache(path)
+            self.assertIsNotNone(loaded)
+
+            expected = get_crs()
+            self.assertEqual(len(expected), len(loaded.BASIS_G))
+            for got_point, expected_point in zip(loaded.BASIS_G, expected):
+                self.assertEqual(got_point.to_bytes(),
+                                 expected_point.to_bytes())
+            self.assertEqual(crs.commit([Fr(1), Fr(2)]),
+                             loaded.commit([Fr(1), Fr(2)]))
+
+    def test_cache_rejects_corrupted_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crs.bin")
+            save_crs_cache(CRS(get_crs()), path)
+
+            with open(path, "r+b") as f:
+                f.seek(100)
+                byte = f.read(1)
+                f.seek(100)
+                f.write(bytes([byte[0] ^ 1]))
+
+            self.assertIsNone(load_crs_cache(path))
+
+    def _rewrite_points(self, path, points, update_basis_hash=False):
+        """
+            Replaces the basis points in the file and updates the points hash.
+            The basis hash in the header is only updated if `update_basis_hash` is True
+        """
+        points_bytes = _points_to_bytes([point.point for point in points])
+        with open(path, "r+b") as f:
+            if update_basis_hash:
+                f.seek(len(MAGIC))
+                f.write(crs_basis_hash(points))
+            f.seek(HEADER_SIZE)
+            f.write(points_bytes)
+            f.write(hashlib.sha256(points_bytes).digest())
+
+    def test_cache_checks_decoded_points(self):
+        """
+            Test that the basis hash in the header is checked against the decoded points
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crs.bin")
+            basis = get_crs()[:4]
+            save_crs_cache(CRS(basis), path)
+            self.assertIsNotNone(load_crs_cache(path))
+
+            # Points which do not match the basis hash
+            self._rewrite_points(path, [basis[1], basis[0]] + basis[2:])
+            self.assertIsNone(load_crs_cache(path))
+
+            # A point on the curve which is not in the subgroup, since 1 - ax^2 is not a square
+            x = Fp(1)
+            while (Fp.one() - A * x * x).legendre() == 1 or (Fp.one() - D * x * x).legendre() == 1:
+                x = x + Fp.one()
+            y = Fp.zero()
+            y.sqrt((Fp.one() - A * x * x) / (Fp.one() - D * x * x))
+            outside = Banderwagon(None, BandersnatchExtendedPoint(
+                BandersnatchAffinePoint(x, y)))
+            self._rewrite_points(path, [outside] + basis[1:],
+                                 update_basis_hash=True)
+            self.assertIsNone(load_crs_cache(path))
+
+    def test_table_round_trip(self):
+        point = get_crs()[7]
+        table = FixedBaseTable(point, 4)
+
+        loaded = _table_from_bytes(_table_to_bytes(table), 4)
+
+        scalar = Fr(-12345)
+        self.assertEqual(loaded.mul(scalar), point * scalar)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,13 @@
 import hashlib
-from crs import get_crs
+import os
+import subprocess
+import sys
+from crs import get_crs, CRS
 import unittest
-from ecc import Banderwagon
+from ecc import Banderwagon, Fr
+
+# Importing verkle.verkle takes around 0.1 seconds, this leaves room for slow machines
+IMPORT_BUDGET_SECONDS = 1
 
 
 class TestCRS(unittest.TestCase):
@@ -42,6 +48,99 @@ class TestCRS(unittest.TestCase):
         for point in crs:
             self.assertNotEqual(generator, point)
 
+    def test_fixed_base_commit(self):
+        """
+            Test that committing with the fixed base tables gives the same result as the multi scalar multiplication
+        """
+        crs = CRS(get_crs(), fixed_base_window_size=4, max_fixed_base_tables=2)
+
+        values = {0: Fr(-1), 3: Fr(2**200 + 7), 255: Fr(12345)}
+        expected = Banderwagon.msm([crs[i] for i in values.keys()],
+                                   list(values.values()))
+
+        got = crs.fixed_base_commit(values)
+
+        self.assertEqual(got, expected)
+        # Only two tables can be built, the third basis point uses the fallback
+        self.assertEqual(2, len(crs.fixed_base_tables))
+
+        # Tables are disabled by default
+        crs = CRS(get_crs())
+        self.assertEqual(crs.fixed_base_commit(values), expected)
+        self.assertEqual(0, len(crs.fixed_base_tables))
+
+    def test_commit_delta(self):
+        """
+            Test that committing to the changes gives the difference of the two commitments
+        """
+        old = [Fr(i) for i in range(256)]
+        new = list(old)
+        new[0] = Fr(-1)
+        new[7] = Fr(2**200 + 7)
+        new[255] = Fr(12345)
+        changes = {i: (old[i], new[i]) for i in [0, 7, 100, 255]}
+
+        expected = Banderwagon.msm(get_crs(), new) - \
+            Banderwagon.msm(get_crs(), old)
+
+        for crs in [CRS(), CRS(get_crs(), fixed_base_window_size=4, max_fixed_base_tables=1)]:
+            self.assertEqual(crs.commit_delta(changes), expected)
+
+        # Index 100 did not change
+        self.assertTrue(CRS().commit_delta(
+            {100: (old[100], new[100])}).is_identity())
+
+    def test_default_is_shared(self):
+        """
+            Test that the default CRS is only built once and decompresses its points lazily
+        """
+        self.assertIs(CRS.default(), CRS.default())
+        self.assertIsNot(CRS.default(fixed_base_window_size=4), CRS.default())
+
+        crs = CRS()
+        self.assertIsNone(crs._basis_g)
+        self.assertEqual(crs[3], get_crs()[3])
+        self.assertEqual(256, len(crs.BASIS_G))
+        self.assertEqual(256, len(crs))
+
+    def test_basis_is_not_shared(self):
+        """
+            Test that modifying the returned basis points does not change the CRS
+        """
+        expected = get_crs()[0]
+
+        point = CRS.default()[0]
+        point.double(point)
+        basis = CRS.default().BASIS_G
+        basis[0].double(basis[0])
+        basis[1] = Banderwagon.identity()
+        CRS.default()[0:2][0].double(Banderwagon.generator())
+
+        self.assertEqual(CRS.default()[0], expected)
+        self.assertEqual(CRS.default().BASIS_G[:2], get_crs()[:2])
+        self.assertEqual(CRS().BASIS_G[0], expected)
+
+    def test_import_budget(self):
+        """
+            Test that importing the trie is cheap, so short lived processes do not pay for the CRS
+        """
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            "import verkle.verkle\n"
+            "elapsed = time.perf_counter() - start\n"
+            "import crs.crs\n"
+            "print(elapsed, crs.crs._basis is None, 'crs.constants' in sys.modules)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", script], cwd=root,
+                                capture_output=True, check=True, text=True).stdout.split()
+
+        elapsed, basis_is_none, constants_imported = output
+        self.assertLess(float(elapsed), IMPORT_BUDGET_SECONDS)
+        self.assertEqual(basis_is_none, "True")
+        self.assertEqual(constants_imported, "False")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,82 @@
+import hashlib
+from typing import List
+from ecc import Banderwagon
+from ecc.bandersnatch.field_base import BASE_FIELD
+
+# Generates the CRS basis points from a seed.
+# See: https://hackmd.io/1RcGSMQgT4uREaq1CCx_cg#Methodology
+#
+# For increment = 0, 1, 2, ..., the candidate x co-ordinate is
+# sha256(seed || increment as 8 big endian bytes) interpreted as a big endian integer modulo p.
+# Candidates which are not the x co-ordinate of a banderwagon element are skipped.
+#
+# The point which is deserialised from x is chosen so that it serialises to x again,
+# so the serialised basis points are the accepted candidates, in order of their increments.
+
+# Seed used for CRS_CONSTANTS
+DEFAULT_SEED = b"eth_verkle_oct_2021"
+DEFAULT_NUM_POINTS = 256
+
+# Number of increments that each process checks at a time
+CHUNK_SIZE = 128
+
+# Roughly one in four candidates is accepted, since both 1 - ax^2 and 1 - dx^2 must be squares
+CANDIDATES_PER_POINT = 4
+
+
+def _candidate(seed: bytes, increment: int) -> bytes:
+    digest = hashlib.sha256(seed + increment.to_bytes(8, "big")).digest()
+    x = int.from_bytes(digest, "big") % BASE_FIELD
+    return x.to_bytes(32, "big")
+
+
+# Returns the accepted candidates for the increments in [start, start + count), in order
+def _accepted_candidates(seed: bytes, start: int, count: int) -> List[bytes]:
+    candidates = [_candidate(seed, increment)
+                  for increment in range(start, start + count)]
+    points = Banderwagon.batch_from_bytes(candidates)
+    return [candidate for candidate, point in zip(candidates, points) if point is not None]
+
+
+# Returns the first `num_points` serialised basis points for `seed`.
+#
+# If `processes` is more than one, the candidates are checked in chunks by that many worker processes.
+# The result does not depend on the number of processes.
+def generate_points_bytes(num_points: int = DEFAULT_NUM_POINTS, seed: bytes = DEFAULT_SEED, processes=None) -> List[bytes]:
+    executor = None
+    if processes is not None and processes > 1:
+        # Imported here, since it is slow to import and most callers do not need it
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=processes)
+
+    result = []
+    next_increment = 0
+    try:
+        while len(result) < num_points:
+            remaining = num_points - len(result)
+            num_chunks = -(-remaining * CANDIDATES_PER_POINT // CHUNK_SIZE)
+            if executor is not None:
+                num_chunks = max(num_chunks, processes)
+            starts = [next_increment + i *
+                      CHUNK_SIZE for i in range(num_chunks)]
+            next_increment += num_chunks * CHUNK_SIZE
+
+            if executor is None:
+                chunks = [_accepted_candidates(seed, start, CHUNK_SIZE)
+                          for start in starts]
+            else:
+                chunks = executor.map(_accepted_candidates, [seed] * num_chunks,
+                                      starts, [CHUNK_SIZE] * num_chunks)
+
+            for chunk in chunks:
+                result += chunk
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return result[:num_points]
+
+
+def generate_points(num_points: int = DEFAULT_NUM_POINTS, seed: bytes = DEFAULT_SEED, processes=None) -> List[Banderwagon]:
+    points_bytes = generate_points_bytes(num_points, seed, processes)
+    return Banderwagon.batch_from_bytes(points_bytes, processes)
@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+from crs import CRS
+from .constants import CRS_CONSTANTS
+from .cache import crs_basis_hash, crs_constants_hash, load_crs_cache, save_crs_cache
+from .generate import generate_points_bytes
+
+
+class TestGenerateCRS(unittest.TestCase):
+
+    def test_default_seed_matches_constants(self):
+        """
+            Test that the default seed gives the hardcoded CRS, with and without worker processes
+        """
+        got = [point.hex() for point in generate_points_bytes()]
+        self.assertEqual(got, CRS_CONSTANTS)
+
+        got = [point.hex() for point in generate_points_bytes(20, processes=2)]
+        self.assertEqual(got, CRS_CONSTANTS[:20])
+
+    def test_generate_crs(self):
+        crs = CRS.generate_crs()
+
+        self.assertEqual(crs_basis_hash(crs.BASIS_G), crs_constants_hash())
+
+        # More points extend the default basis
+        crs = CRS.generate_crs(num_points=300)
+        self.assertEqual(300, len(crs.BASIS_G))
+        self.assertEqual(bytes(crs[255].to_bytes()).hex(), CRS_CONSTANTS[255])
+
+    def test_generated_crs_cache(self):
+        crs = CRS.generate_crs(b"another seed", num_points=16)
+        self.assertNotEqual(bytes(crs[0].to_bytes()).hex(), CRS_CONSTANTS[0])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "crs.bin")
+            save_crs_cache(crs, path, 2)
+
+            # The file does not hold the default CRS
+            self.assertIsNone(load_crs_cache(
+                path, basis_hash=crs_constants_hash()))
+
+            loaded = load_crs_cache(
+                path, basis_hash=crs_basis_hash(crs.BASIS_G))
+            self.assertEqual(16, len(loaded.BASIS_G))
+            for got_point, expected_point in zip(loaded.BASIS_G, crs.BASIS_G):
+                self.assertEqual(got_point, expected_point)
+            self.assertEqual(2, loaded.fixed_base_window_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
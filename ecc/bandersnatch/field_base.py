@@ -1,4 +1,6 @@
-from ..field import Field
+from ..field import PrimeField
+from ..field import backend
+from ..field.field import legendre_symbol
 
 # This is the basefield assosciated with the bandersnatch curve
 BASE_FIELD = 52435875175126190479447740508185965837690552500527637822603658699938581184513
@@ -8,52 +10,131 @@ Q_MIN_ONE_DIV_2 = (BASE_FIELD - 1) // 2
 
 BYTE_LEN = 32
 
-
-class Fp(Field):
-    def __init__(self, value=None, generic_field=None):
-        if generic_field is not None:
-            assert generic_field.modulus == BASE_FIELD
-            super().__init__(generic_field.value, BASE_FIELD)
-            return
-
-        super().__init__(value, BASE_FIELD)
+# Square roots use Tonelli-Shanks with precomputed tables, see `_sqrt_with_legendre`
+#
+# BASE_FIELD - 1 = 2^TWO_ADICITY * TRACE with TRACE odd
+TWO_ADICITY = 32
+TRACE = (BASE_FIELD - 1) >> TWO_ADICITY
+assert TRACE % 2 == 1
+
+# The discrete logarithm in the subgroup of order 2^TWO_ADICITY is found SQRT_WINDOW bits at a time
+SQRT_WINDOW = 8
+SQRT_NUM_WINDOWS = TWO_ADICITY // SQRT_WINDOW
+_WINDOW_MASK = (1 << SQRT_WINDOW) - 1
+
+
+def _smallest_non_residue():
+    n = 2
+    while legendre_symbol(n, BASE_FIELD) != -1:
+        n += 1
+    return n
+
+
+NON_RESIDUE = _smallest_non_residue()
+# Generates the subgroup of order 2^TWO_ADICITY
+ROOT_OF_UNITY = pow(NON_RESIDUE, TRACE, BASE_FIELD)
+_ROOT_OF_UNITY_INV = pow(ROOT_OF_UNITY, -1, BASE_FIELD)
+
+
+# Returns tables[i][j] = ROOT_OF_UNITY^-(j * 2^(SQRT_WINDOW * i))
+def _inv_root_powers():
+    tables = []
+    for i in range(SQRT_NUM_WINDOWS):
+        base = pow(_ROOT_OF_UNITY_INV, 1 << (SQRT_WINDOW * i), BASE_FIELD)
+        powers = [1]
+        for _ in range(_WINDOW_MASK):
+            powers.append(powers[-1] * base % BASE_FIELD)
+        tables.append(powers)
+    return tables
+
+
+_INV_ROOT_POWERS = _inv_root_powers()
+
+# Maps every element of the subgroup of order 2^SQRT_WINDOW to its discrete logarithm
+_SMALL_ROOT = pow(ROOT_OF_UNITY, 1 << (TWO_ADICITY - SQRT_WINDOW), BASE_FIELD)
+_SMALL_DLOG = {pow(_SMALL_ROOT, j, BASE_FIELD): j for j in range(1 << SQRT_WINDOW)}
+
+
+# Returns (root, legendre symbol) for a reduced integer, root is None if `a` is not a square.
+#
+# With w = a^((TRACE-1)/2), x = a * w = a^((TRACE+1)/2) and b = x * w = a^TRACE.
+# b lies in the subgroup of order 2^TWO_ADICITY, so b = ROOT_OF_UNITY^k for some k, which we find
+# one window at a time with the tables above. `a` is a square if and only if k is even
+# and then x * ROOT_OF_UNITY^(-k/2) is a square root of `a`.
+#
+# This needs a single exponentiation, where the generic `modular_sqrt` needs a
+# legendre symbol, a search for a non-residue and a Tonelli-Shanks loop of exponentiations.
+def _sqrt_with_legendre(a: int):
+    if a == 0:
+        return 0, 0
+
+    p = BASE_FIELD
+    w = backend.powmod(a, (TRACE - 1) // 2, p)
+    x = a * w % p
+    b = x * w % p
+
+    # b_powers[i] = b^(2^(SQRT_WINDOW * i))
+    b_powers = [b]
+    for _ in range(SQRT_NUM_WINDOWS - 1):
+        b_powers.append(pow(b_powers[-1], 1 << SQRT_WINDOW, p))
+
+    k_windows = []
+    for i in range(SQRT_NUM_WINDOWS):
+        # Remove the windows of k that we already know, what remains lies in the small subgroup
+        shift = SQRT_NUM_WINDOWS - 1 - i
+        t = b_powers[shift]
+        for j, k_j in enumerate(k_windows):
+            t = t * _INV_ROOT_POWERS[shift + j][k_j] % p
+        k_windows.append(_SMALL_DLOG[t])
+
+        if i == 0 and k_windows[0] % 2 == 1:
+            return None, -1
+
+    k = 0
+    for i, k_i in enumerate(k_windows):
+        k |= k_i << (SQRT_WINDOW * i)
+
+    half_k = k >> 1
+    root = x
+    for i in range(SQRT_NUM_WINDOWS):
+        root = root * _INV_ROOT_POWERS[i][(half_k >> (SQRT_WINDOW * i)) & _WINDOW_MASK] % p
+
+    return root, 1
+
+
+class Fp(PrimeField):
+    __slots__ = ()
+
+    MODULUS = BASE_FIELD
+    BYTE_LEN = BYTE_LEN
+    Q_MIN_ONE_DIV_2 = Q_MIN_ONE_DIV_2
 
     def zero():
-        return Fp(None, Field.zero(BASE_FIELD))
+        return PrimeField._zero(Fp)
 
     def one():
-        return Fp(None, Field.one(BASE_FIELD))
+        return PrimeField._one(Fp)
 
     def from_bytes(bytes):
-        return Fp(None, Field.from_bytes(bytes, BASE_FIELD))
+        return PrimeField._from_bytes(Fp, bytes)
 
     def from_bytes_reduce(bytes):
-        return Fp(None, Field.from_bytes_reduce(bytes, BASE_FIELD))
-
-    def to_bytes(self):
-        return super().to_bytes(BYTE_LEN)
-
-    def lexographically_largest(self):
-        return super().lexographically_largest(Q_MIN_ONE_DIV_2)
+        return PrimeField._from_bytes_reduce(Fp, bytes)
 
     def multi_inv(values):
-        result = []
-        inverses = Field.multi_inv(values)
-        for inv in inverses:
-            result.append(Fp(None, inv))
-        return result
-
-    def __add__(self, other):
-        return Fp(None, super().__add__(other))
-
-    def __sub__(self, other):
-        return Fp(None, super().__sub__(other))
-
-    def __mul__(self, other):
-        return Fp(None, super().__mul__(other))
-
-    def __neg__(self):
-        return Fp(None, super().__neg__())
-
-    def __truediv__(self, other):
-        return Fp(None, super().__truediv__(other))
+        return PrimeField._multi_inv(Fp, values)
+
+    def sqrt(self, a):
+        root, _ = _sqrt_with_legendre(a.value)
+        if root is None:
+            return None
+        self.value = root
+        return self
+
+    # Returns the square root of `a`, or None if it does not exist, and the legendre symbol of `a`.
+    # This is cheaper than calling `legendre` and then `sqrt`
+    def sqrt_with_legendre(a):
+        root, legendre = _sqrt_with_legendre(a.value)
+        if root is None:
+            return None, legendre
+        return PrimeField._from_reduced(Fp, root), legendre
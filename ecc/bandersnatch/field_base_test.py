@@ -0,0 +1,34 @@
+import unittest
+from .field_base import Fp, BASE_FIELD
+from ..field.field import legendre_symbol, modular_sqrt
+
+
+class TestBaseField(unittest.TestCase):
+
+    def test_sqrt_with_legendre(self):
+        values = [0, 1, 2, 3, 4, 5, 25, BASE_FIELD - 1, BASE_FIELD - 4]
+        values += [(i * 0x1234567890abcdef) ** 3 % BASE_FIELD for i in range(1, 50)]
+
+        for value in values:
+            root, legendre = Fp.sqrt_with_legendre(Fp(value))
+
+            self.assertEqual(legendre, legendre_symbol(value, BASE_FIELD))
+            if legendre == -1:
+                self.assertIsNone(root)
+                self.assertIsNone(modular_sqrt(value, BASE_FIELD))
+            else:
+                self.assertEqual(root * root, Fp(value))
+
+    def test_sqrt(self):
+        a = Fp(12345)
+        a_sq = a * a
+
+        root = Fp.zero()
+        root.sqrt(a_sq)
+
+        self.assertTrue(root == a or root == -a)
+        self.assertIsNone(Fp.zero().sqrt(Fp(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
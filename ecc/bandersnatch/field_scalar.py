@@ -1,4 +1,4 @@
-from ..field import Field
+from ..field import PrimeField
 
 # This is the scalar field assosciated with the bandersnatch curve
 SCALAR_FIELD = 13108968793781547619861935127046491459309155893440570251786403306729687672801
@@ -9,51 +9,24 @@ Q_MIN_ONE_DIV_2 = (SCALAR_FIELD - 1) // 2
 BYTE_LEN = 32
 
 
-class Fr(Field):
-    def __init__(self, value=None, generic_field=None):
-        if generic_field is not None:
-            assert generic_field.modulus == SCALAR_FIELD
-            super().__init__(generic_field.value, SCALAR_FIELD)
-            return
+class Fr(PrimeField):
+    __slots__ = ()
 
-        super().__init__(value, SCALAR_FIELD)
+    MODULUS = SCALAR_FIELD
+    BYTE_LEN = BYTE_LEN
+    Q_MIN_ONE_DIV_2 = Q_MIN_ONE_DIV_2
 
     def zero():
-        return Fr(None, Field.zero(SCALAR_FIELD))
+        return PrimeField._zero(Fr)
 
     def one():
-        return Fr(None, Field.one(SCALAR_FIELD))
+        return PrimeField._one(Fr)
 
     def from_bytes(bytes):
-        return Fr(None, Field.from_bytes(bytes, SCALAR_FIELD))
+        return PrimeField._from_bytes(Fr, bytes)
 
     def from_bytes_reduce(bytes):
-        return Fr(None, Field.from_bytes_reduce(bytes, SCALAR_FIELD))
-
-    def to_bytes(self):
-        return super().to_bytes(BYTE_LEN)
-
-    def lexographically_largest(self):
-        return super().lexographically_largest(Q_MIN_ONE_DIV_2)
+        return PrimeField._from_bytes_reduce(Fr, bytes)
 
     def multi_inv(values):
-        result = []
-        inverses = Field.multi_inv(values)
-        for inv in inverses:
-            result.append(Fr(None, inv))
-        return result
-
-    def __add__(self, other):
-        return Fr(None, super().__add__(other))
-
-    def __sub__(self, other):
-        return Fr(None, super().__sub__(other))
-
-    def __mul__(self, other):
-        return Fr(None, super().__mul__(other))
-
-    def __neg__(self):
-        return Fr(None, super().__neg__())
-
-    def __truediv__(self, other):
-        return Fr(None, super().__truediv__(other))
+        return PrimeField._multi_inv(Fr, values)
@@ -0,0 +1,136 @@
+from math import isqrt
+from .field_base import Fp
+from .field_scalar import Fr, SCALAR_FIELD
+from .twedards import BandersnatchExtendedPoint
+from .straus import straus
+
+# Bandersnatch has an efficiently computable endomorphism psi of degree 2,
+# which acts as multiplication by LAMBDA on the prime order subgroup.
+# See section 5 of the bandersnatch paper: https://ia.cr/2021/1152
+#
+# psi(x, y, z) = (f(y) * h(y), g(y) * x * y, h(y) * x * y)
+# f(y) = c * (z^2 - y^2)
+# g(y) = b * (y^2 + b * z^2)
+# h(y) = y^2 - b * z^2
+#
+# The kernel of psi is {O, (0, -1)}, so on points which differ from the prime order subgroup
+# by the two torsion point, psi(P) and LAMBDA * P differ by (0, -1). Banderwagon quotients out this
+# point, so the results here are only correct as banderwagon elements.
+ENDO_B = Fp(0x52c9f28b828426a561f00d3a63511a882ea712770d9af4d6ee0f014d172510b4)
+ENDO_C = Fp(0x6cc624cf865457c3a97c6efd6c17d1078456abcfff36f4e9515c806cdf650b3d)
+
+# LAMBDA^2 + 2 = 0 mod SCALAR_FIELD
+LAMBDA = 8913659658109529928382530854484400854125314752504019737736543920008458395397
+
+GLV_WNAF_WIDTH = 4
+
+
+def _short_lattice_basis(n, lam):
+    # Finds two short vectors (a, b) with a + b * lam = 0 mod n
+    # See "Guide to Elliptic Curve Cryptography" Algorithm 3.74
+    #
+    # The extended euclidean algorithm on (n, lam) gives remainders
+    # r_i = s_i * n + t_i * lam, so (r_i, -t_i) is in the lattice
+    sqrt_n = isqrt(n)
+    r0, r1 = n, lam
+    t0, t1 = 0, 1
+    while r1 >= sqrt_n:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        t0, t1 = t1, t0 - q * t1
+
+    v1 = (r1, -t1)
+
+    q = r0 // r1
+    r2, t2 = r0 - q * r1, t0 - q * t1
+    if r0 * r0 + t0 * t0 <= r2 * r2 + t2 * t2:
+        v2 = (r0, -t0)
+    else:
+        v2 = (r2, -t2)
+
+    return v1, v2
+
+
+GLV_BASIS = _short_lattice_basis(SCALAR_FIELD, LAMBDA)
+
+
+def _round_div(num, den):
+    # Rounds num / den to the nearest integer, den must be positive
+    return (2 * num + den) // (2 * den)
+
+
+# Splits k into (k1, k2) with k = k1 + k2 * LAMBDA mod SCALAR_FIELD
+# Both k1 and k2 have about half the bits of the scalar field and may be negative
+def decompose_scalar(k: int):
+    (a1, b1), (a2, b2) = GLV_BASIS
+    # Write (k, 0) in terms of the basis and round the coefficients.
+    # The determinant of the basis is either n or -n
+    det = a1 * b2 - a2 * b1
+    if det < 0:
+        c1 = _round_div(-b2 * k, -det)
+        c2 = _round_div(b1 * k, -det)
+    else:
+        c1 = _round_div(b2 * k, det)
+        c2 = _round_div(-b1 * k, det)
+
+    k1 = k - c1 * a1 - c2 * a2
+    k2 = -c1 * b1 - c2 * b2
+    return k1, k2
+
+
+def endomorphism(point: BandersnatchExtendedPoint) -> BandersnatchExtendedPoint:
+    x = point.x
+    y = point.y
+    z = point.z
+
+    # The formula is not defined for x = 0, which is the identity or (0, -1)
+    # Both of these are in the kernel of psi
+    if x.is_zero():
+        return BandersnatchExtendedPoint.identity()
+
+    y_sq = y * y
+    z_sq = z * z
+    b_z_sq = ENDO_B * z_sq
+    xy = x * y
+
+    f = ENDO_C * (z_sq - y_sq)
+    g = ENDO_B * (y_sq + b_z_sq)
+    h = y_sq - b_z_sq
+
+    return BandersnatchExtendedPoint._from_coordinates(f * h, g * xy, f * g, h * xy)
+
+
+def _neg(point: BandersnatchExtendedPoint) -> BandersnatchExtendedPoint:
+    return BandersnatchExtendedPoint._from_coordinates(-point.x, point.y, -point.t, point.z)
+
+
+# Returns LAMBDA * P in banderwagon
+def lambda_multiple(point: BandersnatchExtendedPoint) -> BandersnatchExtendedPoint:
+    result = endomorphism(point)
+    if result.z.is_zero():
+        # Should not happen for points on the curve, but if the formula
+        # is not defined, we compute LAMBDA * P the slow way
+        result = BandersnatchExtendedPoint.identity()
+        result.scalar_mul(point, Fr(LAMBDA))
+    return result
+
+
+# Returns (k1, P1, k2, P2) with k1, k2 >= 0 and k1 * P1 + k2 * P2 = k * P in banderwagon
+def decompose(point: BandersnatchExtendedPoint, k: int):
+    k1, k2 = decompose_scalar(k)
+    p1 = point
+    p2 = lambda_multiple(point)
+    if k1 < 0:
+        k1 = -k1
+        p1 = _neg(p1)
+    if k2 < 0:
+        k2 = -k2
+        p2 = _neg(p2)
+    return k1, p1, k2, p2
+
+
+# Scalar multiplication using the endomorphism, this needs about half of the doublings
+# of a regular scalar multiplication. The result is only correct as a banderwagon element.
+def glv_scalar_mul(point: BandersnatchExtendedPoint, scalar: Fr, width=GLV_WNAF_WIDTH) -> BandersnatchExtendedPoint:
+    k1, p1, k2, p2 = decompose(point, scalar.value)
+    return straus([p1, p2], [k1, k2], width)
@@ -0,0 +1,46 @@
+import unittest
+from .field_scalar import Fr, SCALAR_FIELD
+from .twedards import BandersnatchExtendedPoint
+from .glv import LAMBDA, decompose_scalar, endomorphism, glv_scalar_mul
+from ..banderwagon import Banderwagon
+
+
+class TestGLV(unittest.TestCase):
+
+    def test_lambda(self):
+        self.assertEqual((LAMBDA * LAMBDA + 2) % SCALAR_FIELD, 0)
+
+    def test_endomorphism(self):
+        gen = BandersnatchExtendedPoint.generator()
+
+        expected = gen * Fr(LAMBDA)
+        got = endomorphism(gen)
+
+        self.assertEqual(expected, got)
+        self.assertTrue(endomorphism(
+            BandersnatchExtendedPoint.identity()).is_zero())
+
+    def test_decompose_scalar(self):
+        for k in [0, 1, 2**127, 2**200 + 12345, SCALAR_FIELD - 1]:
+            k1, k2 = decompose_scalar(k)
+
+            self.assertEqual((k1 + k2 * LAMBDA - k) % SCALAR_FIELD, 0)
+            self.assertLessEqual(abs(k1).bit_length(), 128)
+            self.assertLessEqual(abs(k2).bit_length(), 128)
+
+    def test_glv_scalar_mul(self):
+        gen = Banderwagon.generator()
+        # A representative which is not in the prime order subgroup
+        point = gen + Banderwagon.two_torsion_point()
+
+        for integer in [0, 1, 2, 12345, 2**200 + 1, -1]:
+            scalar = Fr(integer)
+
+            expected = Banderwagon.msm_naive([gen], [scalar])
+            got = Banderwagon(None, glv_scalar_mul(point.point, scalar))
+
+            self.assertEqual(expected, got)
+
+
+if __name__ == '__main__':
+    unittest.main()
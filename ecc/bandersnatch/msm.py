@@ -0,0 +1,149 @@
+from typing import List
+from .twedards import BandersnatchExtendedPoint, BandersnatchCachedPoint
+from .field_scalar import Fr, SCALAR_FIELD
+from .glv import decompose_scalar, lambda_multiple
+from .straus import straus
+
+# Number of bits needed to represent a reduced scalar
+SCALAR_BITS = SCALAR_FIELD.bit_length()
+
+# Multi scalar multiplications with at most this many terms are cheaper with `straus_msm`,
+# because `pippenger` needs to set up buckets for every window
+STRAUS_MAX_TERMS = 8
+
+# Window sizes that we consider when choosing one automatically
+MIN_WINDOW_SIZE = 1
+MAX_WINDOW_SIZE = 16
+
+
+def optimal_window_size(num_points: int, scalar_bits=SCALAR_BITS) -> int:
+    # Each window costs one addition per point to fill the buckets
+    # and roughly two additions per bucket to sum them up.
+    # The doublings are the same for every window size, so we ignore them.
+    best_window = MIN_WINDOW_SIZE
+    best_cost = None
+    for window_size in range(MIN_WINDOW_SIZE, MAX_WINDOW_SIZE + 1):
+        num_windows = -(-scalar_bits // window_size)
+        cost = num_windows * (num_points + 2 * (2**window_size))
+        if best_cost is None or cost < best_cost:
+            best_cost = cost
+            best_window = window_size
+    return best_window
+
+
+# Every point is added once per window, so `pippenger` converts the points to cached form first.
+# For points which are used in many multi scalar multiplications, such as the CRS,
+# this can be done once with this function and the result passed to `pippenger` as `bases`.
+#
+# If `glv` is True, LAMBDA * P is stored after each point P, see `pippenger`
+def precompute_bases(points: List[BandersnatchExtendedPoint], glv=False) -> List[BandersnatchCachedPoint]:
+    if glv:
+        points = [p for point in points for p in [point, lambda_multiple(point)]]
+    return BandersnatchExtendedPoint.batch_to_cached(points)
+
+
+# Multi scalar multiplication using the bucket method
+# See: https://eprint.iacr.org/2012/549.pdf section 4
+#
+# If `glv` is True, each scalar is split into two half sized scalars using the endomorphism, see glv.py.
+# This halves the number of windows, but the result is only correct as a banderwagon element.
+#
+# `bases` is the result of `precompute_bases(points, glv)` and may be longer than `scalars`,
+# in which case only its prefix is used. If it is given, `points` is not used.
+def pippenger(points: List[BandersnatchExtendedPoint], scalars: List[Fr], window_size=None, glv=False, bases=None) -> BandersnatchExtendedPoint:
+    scalars = [scalar.value for scalar in scalars]
+    if bases is None:
+        points = list(points)
+        assert len(points) == len(scalars)
+        bases = precompute_bases(points, glv)
+    else:
+        assert len(bases) >= len(scalars) * (2 if glv else 1)
+
+    if glv:
+        split_bases = []
+        split_scalars = []
+        for i, scalar in enumerate(scalars):
+            k1, k2 = decompose_scalar(scalar)
+            p1 = bases[2 * i]
+            p2 = bases[2 * i + 1]
+            if k1 < 0:
+                k1 = -k1
+                p1 = -p1
+            if k2 < 0:
+                k2 = -k2
+                p2 = -p2
+            split_bases += [p1, p2]
+            split_scalars += [k1, k2]
+        bases = split_bases
+        scalars = split_scalars
+
+    result = BandersnatchExtendedPoint.identity()
+    if len(scalars) == 0:
+        return result
+
+    scalar_bits = max(scalar.bit_length() for scalar in scalars)
+    if scalar_bits == 0:
+        return result
+
+    if window_size is None:
+        window_size = optimal_window_size(len(scalars), scalar_bits)
+
+    num_windows = -(-scalar_bits // window_size)
+    mask = (1 << window_size) - 1
+
+    for window in reversed(range(num_windows)):
+        for _ in range(window_size):
+            result.double(result)
+
+        shift = window * window_size
+        buckets = [None] * mask
+        for base, scalar in zip(bases, scalars):
+            digit = (scalar >> shift) & mask
+            if digit == 0:
+                continue
+            bucket = buckets[digit - 1]
+            if bucket is None:
+                # The co-ordinates are never modified in place, so they can be shared
+                buckets[digit - 1] = base.to_extended()
+            else:
+                bucket.add_cached(bucket, base)
+
+        # Bucket i is counted i times by summing the running sums
+        # sum_{i} i * B_i = sum_{j} (B_j + B_{j+1} + ... + B_max)
+        running_sum = None
+        window_sum = None
+        for bucket in reversed(buckets):
+            if bucket is not None:
+                if running_sum is None:
+                    running_sum = bucket
+                else:
+                    running_sum.add(running_sum, bucket)
+            if running_sum is not None:
+                if window_sum is None:
+                    window_sum = running_sum.dup()
+                else:
+                    window_sum.add(window_sum, running_sum)
+
+        if window_sum is not None:
+            result.add(result, window_sum)
+
+    return result
+
+
+# Same as `pippenger`, but using `straus`. This is faster for a few terms, see STRAUS_MAX_TERMS
+def straus_msm(points: List[BandersnatchExtendedPoint], scalars: List[Fr], glv=False, bases=None) -> BandersnatchExtendedPoint:
+    scalars = [scalar.value for scalar in scalars]
+    num_points = len(scalars) * (2 if glv else 1)
+    if bases is None:
+        points = list(points)
+        assert len(points) == len(scalars)
+        if glv:
+            points = [p for point in points for p in [point, lambda_multiple(point)]]
+    else:
+        assert len(bases) >= num_points
+        points = [base.to_extended() for base in bases[:num_points]]
+
+    if glv:
+        scalars = [k for scalar in scalars for k in decompose_scalar(scalar)]
+
+    return straus(points, scalars)
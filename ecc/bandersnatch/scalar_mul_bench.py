@@ -0,0 +1,52 @@
+import hashlib
+import timeit
+from .field_scalar import Fr
+from .twedards import BandersnatchExtendedPoint, SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF, SCALAR_MUL_GLV
+from .glv import glv_scalar_mul
+
+# Compares the variable base scalar multiplication methods
+#
+# Example: `python -m ecc.bandersnatch.scalar_mul_bench`
+
+
+def bench_scalar_mul(method, width=None, num_scalars=20, repeat=5):
+    from . import twedards
+    if width is None:
+        width = twedards.wnaf_width
+
+    old_width = twedards.wnaf_width
+    twedards.wnaf_width = width
+
+    point = BandersnatchExtendedPoint.generator()
+    scalars = [Fr.from_bytes_reduce(hashlib.sha256(bytes([i])).digest())
+               for i in range(num_scalars)]
+
+    # Bandersnatch points fall back to wnaf for glv, so it is timed directly.
+    # This is the path taken by `Banderwagon.scalar_mul`
+    if method == SCALAR_MUL_GLV:
+        def run():
+            for scalar in scalars:
+                glv_scalar_mul(point, scalar, width)
+    else:
+        def run():
+            for scalar in scalars:
+                BandersnatchExtendedPoint.identity().scalar_mul(point, scalar, method)
+
+    try:
+        best = min(timeit.repeat(run, number=1, repeat=repeat))
+    finally:
+        twedards.wnaf_width = old_width
+    return best / num_scalars
+
+
+if __name__ == '__main__':
+    baseline = bench_scalar_mul(SCALAR_MUL_DOUBLE_AND_ADD)
+    print("{:<16} {:>10.3f} ms".format("double and add", baseline * 1000))
+    for width in range(2, 8):
+        got = bench_scalar_mul(SCALAR_MUL_WNAF, width)
+        print("{:<16} {:>10.3f} ms  ({:.2f}x)".format(
+            "wnaf w=" + str(width), got * 1000, baseline / got))
+    for width in range(2, 8):
+        got = bench_scalar_mul(SCALAR_MUL_GLV, width)
+        print("{:<16} {:>10.3f} ms  ({:.2f}x)".format(
+            "glv w=" + str(width), got * 1000, baseline / got))
@@ -0,0 +1,57 @@
+from typing import List
+from .twedards import BandersnatchExtendedPoint, wnaf
+
+STRAUS_WNAF_WIDTH = 4
+
+
+# Computes sum k_i * P_i using interleaved width-w NAFs, see
+# "Guide to Elliptic Curve Cryptography" Algorithm 3.51.
+#
+# All of the terms share the doublings, so for a few terms this is cheaper than separate
+# scalar multiplications, and unlike the bucket method, it needs almost no setup.
+# Scalars are integers and may be negative.
+def straus(points: List[BandersnatchExtendedPoint], scalars: List[int], width=STRAUS_WNAF_WIDTH) -> BandersnatchExtendedPoint:
+    assert len(points) == len(scalars)
+
+    all_digits = []
+    table_points = []
+    for point, scalar in zip(points, scalars):
+        if scalar == 0:
+            continue
+        if scalar < 0:
+            scalar = -scalar
+            point = -point
+        all_digits.append(wnaf(scalar, width))
+
+        # Odd multiples P, 3P, 5P, ..., (2^(w-1) - 1)P
+        double_point = BandersnatchExtendedPoint.identity()
+        double_point.double(point)
+        table = [point]
+        for _ in range((1 << (width - 2)) - 1):
+            table.append(table[-1] + double_point)
+        table_points += table
+
+    if len(all_digits) == 0:
+        return BandersnatchExtendedPoint.identity()
+
+    # Convert every table to cached form with a single inversion
+    table_size = 1 << (width - 2)
+    cached = BandersnatchExtendedPoint.batch_to_cached(table_points)
+    tables = [cached[i:i + table_size]
+              for i in range(0, len(cached), table_size)]
+    neg_tables = [[-p for p in table] for table in tables]
+
+    num_digits = max(len(digits) for digits in all_digits)
+    result = BandersnatchExtendedPoint.identity()
+    for i in reversed(range(num_digits)):
+        result.double(result)
+        for digits, table, neg_table in zip(all_digits, tables, neg_tables):
+            if i >= len(digits):
+                continue
+            digit = digits[i]
+            if digit > 0:
+                result.add_cached(result, table[digit >> 1])
+            elif digit < 0:
+                result.add_cached(result, neg_table[(-digit) >> 1])
+
+    return result
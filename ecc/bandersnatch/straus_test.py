@@ -0,0 +1,51 @@
+import unittest
+from .twedards import BandersnatchExtendedPoint
+from .field_scalar import Fr
+from .msm import straus_msm
+from .straus import straus
+
+
+def points(n):
+    generator = BandersnatchExtendedPoint.generator()
+    return [generator * Fr(i + 2) for i in range(n)]
+
+
+def naive(points, scalars):
+    result = BandersnatchExtendedPoint.identity()
+    for point, scalar in zip(points, scalars):
+        if scalar < 0:
+            result = result - point * Fr(-scalar)
+        else:
+            result = result + point * Fr(scalar)
+    return result
+
+
+class TestStraus(unittest.TestCase):
+
+    def test_straus(self):
+        bases = points(4)
+        scalars = [12345678901234567890, -987654321, 0, Fr.MODULUS - 1]
+
+        for width in [2, 3, 4, 5]:
+            got = straus(bases, scalars, width)
+            self.assertTrue(got == naive(bases, scalars))
+
+    def test_straus_zero_scalars(self):
+        bases = points(2)
+
+        got = straus(bases, [0, 0])
+
+        self.assertTrue(got == BandersnatchExtendedPoint.identity())
+
+    def test_straus_msm(self):
+        bases = points(3)
+        scalars = [Fr(-1), Fr(2**200 + 5), Fr(7)]
+
+        got = straus_msm(bases, scalars)
+
+        expected = naive(bases, [scalar.value for scalar in scalars])
+        self.assertTrue(got == expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
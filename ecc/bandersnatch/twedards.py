@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import List
 from .field_base import Fp
-import copy
 
 from .field_scalar import Fr
 
@@ -14,10 +14,57 @@ d_den.inv(d_den)
 
 D = d_num * d_den
 
+# Methods which can be used for variable base scalar multiplication
+SCALAR_MUL_DOUBLE_AND_ADD = "double_and_add"
+SCALAR_MUL_WNAF = "wnaf"
+# Splits the scalar with the endomorphism, see `glv.glv_scalar_mul`.
+# This is only correct in the banderwagon quotient group, so bandersnatch points use wnaf instead
+SCALAR_MUL_GLV = "glv"
+
+# The method used by `BandersnatchExtendedPoint.scalar_mul` and `Banderwagon.scalar_mul`,
+# see `set_scalar_mul_method`
+scalar_mul_method = SCALAR_MUL_GLV
+# Width of the non-adjacent form, which is also used for both halves of a glv scalar.
+# A width of w needs 2^(w-2) precomputed points
+wnaf_width = 4
+
+
+def set_scalar_mul_method(method, width=None):
+    global scalar_mul_method, wnaf_width
+    if method not in [SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF, SCALAR_MUL_GLV]:
+        raise Exception("unknown scalar multiplication method", method)
+    scalar_mul_method = method
+    if width is not None:
+        if width < 2:
+            raise Exception("wnaf width must be at least 2")
+        wnaf_width = width
+
+
+# Computes the width-w non-adjacent form of a non-negative integer.
+# Every non-zero digit is odd and lies in (-2^(w-1), 2^(w-1)) and
+# any w consecutive digits contain at most one non-zero digit.
+# The least significant digit is returned first.
+def wnaf(value: int, width: int):
+    window = 1 << width
+    half_window = window >> 1
+
+    digits = []
+    while value > 0:
+        digit = 0
+        if value & 1:
+            digit = value & (window - 1)
+            if digit >= half_window:
+                digit -= window
+            value -= digit
+        digits.append(digit)
+        value >>= 1
+    return digits
+
 
 # Bandersnatch using affine co-ordinates
 @dataclass
 class BandersnatchAffinePoint():
+    __slots__ = ("x", "y")
     x: Fp
     y: Fp
 
@@ -84,7 +131,29 @@ class BandersnatchAffinePoint():
         return self
 
     def double(self, p):
-        return self.add(p, p)  # TODO: add dedicated doubling formula
+        # Dedicated doubling formula, which uses the curve equation
+        # to remove the d coefficient from the addition formula
+        # x3 = 2xy / (ax^2 + y^2)
+        # y3 = (y^2 - ax^2) / (2 - ax^2 - y^2)
+        x = p.x
+        y = p.y
+
+        x_sq = x * x
+        y_sq = y * y
+        ax_sq = A * x_sq
+
+        two = Fp(2)
+
+        x_num = two * x * y
+        x_den = ax_sq + y_sq
+
+        y_num = y_sq - ax_sq
+        y_den = two - x_den
+
+        self.x = x_num / x_den
+        self.y = y_num / y_den
+
+        return self
 
     def is_on_curve(self):
         x_sq = self.x * self.x
@@ -120,22 +189,25 @@ class BandersnatchAffinePoint():
         # This is not needed, see `to_bytes`
         return NotImplemented
 
+    # The co-ordinates are never modified in place, so the copy can share them
     def dup(self):
-        return copy.deepcopy(self)
+        point = BandersnatchAffinePoint.__new__(BandersnatchAffinePoint)
+        point.x = self.x
+        point.y = self.y
+        return point
 
     def scalar_mul(self, point, scalar: Fr):
         # using double and add : https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Double-and-add
-        scalar_bits = format(scalar.value, 'b')
+        value = scalar.value
 
         result = BandersnatchAffinePoint.identity()
         temp = point.dup()
 
-        num_bits = len(scalar_bits)
-
-        for i in reversed(range(num_bits)):
-            if scalar_bits[i] == str(1):
+        while value > 0:
+            if value & 1:
                 result.add(result, temp)
             temp.double(temp)
+            value >>= 1
 
         self.x = result.x
         self.y = result.y
@@ -163,9 +235,8 @@ class BandersnatchAffinePoint():
         if y is None:
             return None
 
-        y.sqrt(y)
         # This means that the square root does not exist
-        if y is None:
+        if y.sqrt(y) is None:
             return None
 
         is_largest = y.lexographically_largest()
@@ -206,6 +277,7 @@ class BandersnatchAffinePoint():
 
 @dataclass
 class BandersnatchExtendedPoint():
+    __slots__ = ("x", "y", "t", "z")
     x: Fp
     y: Fp
     t: Fp
@@ -218,6 +290,16 @@ class BandersnatchExtendedPoint():
         self.z = Fp.one()
         pass
 
+    # Creates a point directly from its extended co-ordinates.
+    # No checks are done, so this should only be used with co-ordinates of a valid point
+    def _from_coordinates(x: Fp, y: Fp, t: Fp, z: Fp):
+        point = BandersnatchExtendedPoint.__new__(BandersnatchExtendedPoint)
+        point.x = x
+        point.y = y
+        point.t = t
+        point.z = z
+        return point
+
     def identity():
         affine_point = BandersnatchAffinePoint.identity()
         return BandersnatchExtendedPoint(affine_point)
@@ -252,6 +334,21 @@ class BandersnatchExtendedPoint():
 
         return (p.x * q.z == p.z * q.x) and (p.y * q.z == q.y * p.z)
 
+    # Checks the curve equation in projective co-ordinates, so that the point does not need to be normalised
+    # (aX^2 + Y^2)Z^2 = Z^4 + dX^2Y^2 and XY = TZ
+    def is_on_curve(self):
+        if self.z.is_zero():
+            return False
+
+        x_sq = self.x * self.x
+        y_sq = self.y * self.y
+        z_sq = self.z * self.z
+
+        lhs = (A * x_sq + y_sq) * z_sq
+        rhs = z_sq * z_sq + D * x_sq * y_sq
+
+        return lhs == rhs and self.x * self.y == self.t * self.z
+
     def add(self, p, q):
         # See "Twisted Edwards Curves Revisited" (https: // eprint.iacr.org/2008/522.pdf)
         # by Huseyin Hisil, Kenneth Koon-Ho Wong, Gary Carter, and Ed Dawson
@@ -295,24 +392,86 @@ class BandersnatchExtendedPoint():
         self.add(p, neg_q)
         return self
 
+    # Same as `add`, but `q` is in cached form, which has z = 1 and stores D * t2 and x2 + y2.
+    # This saves two multiplications and an addition, see `BandersnatchCachedPoint`.
+    # See "Twisted Edwards Curves Revisited" (https: // eprint.iacr.org/2008/522.pdf)
+    # 3.1 Unified Addition in E^e, with Z2 = 1
+    def add_cached(self, p, q: BandersnatchCachedPoint):
+        x1 = p.x
+        y1 = p.y
+        t1 = p.t
+        z1 = p.z
+
+        x2 = q.x
+        y2 = q.y
+
+        a = x1 * x2
+
+        b = y1 * y2
+
+        c = t1 * q.d_t
+
+        h = b - (a * A)
+
+        e = (x1 + y1) * q.x_plus_y - a - b
+
+        f = z1 - c
+
+        g = z1 + c
+
+        self.x = e * f
+        self.y = g * h
+        self.t = e * h
+        self.z = f * g
+
+        return self
+
     def double(self, p):
-        # TODO: can replace this with dedicated doubling formula
-        return self.add(p, p)
+        # See "Twisted Edwards Curves Revisited" (https: // eprint.iacr.org/2008/522.pdf)
+        # 3.3 Doubling in E^e
+        x1 = p.x
+        y1 = p.y
+        z1 = p.z
 
-    def scalar_mul(self, point, scalar: Fr):
-        # Same as AffinePoint's equivalent method
-        # using double and add : https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Double-and-add
-        scalar_bits = format(scalar.value, 'b')
+        a = x1 * x1
 
-        result = BandersnatchExtendedPoint.identity()
-        temp = point.dup()
+        b = y1 * y1
 
-        num_bits = len(scalar_bits)
+        c = z1 * z1
+        c = c + c
 
-        for i in reversed(range(num_bits)):
-            if scalar_bits[i] == str(1):
-                result.add(result, temp)
-            temp.double(temp)
+        d = A * a
+
+        e = x1 + y1
+        e = e * e - a - b
+
+        g = d + b
+
+        f = g - c
+
+        h = d - b
+
+        self.x = e * f
+        self.y = g * h
+        self.t = e * h
+        self.z = f * g
+
+        return self
+
+    # `method` defaults to the method set with `set_scalar_mul_method`.
+    # The endomorphism cannot be used outside of the prime order subgroup, so glv falls back to wnaf
+    def scalar_mul(self, point, scalar: Fr, method=None):
+        if method is None:
+            method = scalar_mul_method
+
+        if method == SCALAR_MUL_WNAF or method == SCALAR_MUL_GLV:
+            result = BandersnatchExtendedPoint._scalar_mul_wnaf(
+                point, scalar.value, wnaf_width)
+        elif method == SCALAR_MUL_DOUBLE_AND_ADD:
+            result = BandersnatchExtendedPoint._scalar_mul_double_and_add(
+                point, scalar.value)
+        else:
+            raise Exception("unknown scalar multiplication method", method)
 
         self.x = result.x
         self.y = result.y
@@ -321,6 +480,47 @@ class BandersnatchExtendedPoint():
 
         return self
 
+    def _scalar_mul_double_and_add(point, scalar: int):
+        # Same as AffinePoint's equivalent method
+        # using double and add : https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication#Double-and-add
+        result = BandersnatchExtendedPoint.identity()
+        temp = point.dup()
+
+        while scalar > 0:
+            if scalar & 1:
+                result.add(result, temp)
+            temp.double(temp)
+            scalar >>= 1
+
+        return result
+
+    def _scalar_mul_wnaf(point, scalar: int, width: int):
+        # See "Guide to Elliptic Curve Cryptography" Algorithm 3.36
+        digits = wnaf(scalar, width)
+        if len(digits) == 0:
+            return BandersnatchExtendedPoint.identity()
+
+        # Odd multiples P, 3P, 5P, ..., (2^(w-1) - 1)P
+        double_point = BandersnatchExtendedPoint.identity()
+        double_point.double(point)
+        table = [point]
+        for _ in range((1 << (width - 2)) - 1):
+            table.append(table[-1] + double_point)
+        table = BandersnatchExtendedPoint.batch_to_cached(table)
+        neg_table = [-p for p in table]
+
+        # The most significant digit is always positive
+        result = table[digits[-1] >> 1].to_extended()
+
+        for digit in reversed(digits[:-1]):
+            result.double(result)
+            if digit > 0:
+                result.add_cached(result, table[digit >> 1])
+            elif digit < 0:
+                result.add_cached(result, neg_table[(-digit) >> 1])
+
+        return result
+
     def to_affine(self):
         if self.is_zero():
             return BandersnatchAffinePoint.identity()
@@ -335,12 +535,40 @@ class BandersnatchExtendedPoint():
             y_aff = self.y * z_inv
             return BandersnatchAffinePoint(x_aff, y_aff)
 
+    # Converts many points to affine form using a single field inversion
+    def batch_to_affine(points: List[BandersnatchExtendedPoint]) -> List[BandersnatchAffinePoint]:
+        z_invs = Fp.multi_inv([point.z for point in points])
+
+        result = []
+        for point, z_inv in zip(points, z_invs):
+            result.append(BandersnatchAffinePoint(
+                point.x * z_inv, point.y * z_inv))
+        return result
+
+    # Returns copies of the points with z = 1, using a single field inversion.
+    # The result can be converted to cached form, see `BandersnatchCachedPoint.from_normalized`
+    def batch_normalize(points: List[BandersnatchExtendedPoint]) -> List[BandersnatchExtendedPoint]:
+        z_invs = Fp.multi_inv([point.z for point in points])
+
+        one = Fp.one()
+        result = []
+        for point, z_inv in zip(points, z_invs):
+            result.append(BandersnatchExtendedPoint._from_coordinates(
+                point.x * z_inv, point.y * z_inv, point.t * z_inv, one))
+        return result
+
+    # Converts many points to cached form, using a single field inversion
+    def batch_to_cached(points: List[BandersnatchExtendedPoint]) -> List[BandersnatchCachedPoint]:
+        return [BandersnatchCachedPoint.from_normalized(point)
+                for point in BandersnatchExtendedPoint.batch_normalize(points)]
+
     # Only used for testing purposes.
     def to_bytes(self):
         return self.to_affine().to_bytes()
 
+    # The co-ordinates are never modified in place, so the copy can share them
     def dup(self):
-        return copy.deepcopy(self)
+        return BandersnatchExtendedPoint._from_coordinates(self.x, self.y, self.t, self.z)
 
     # Method overloads
 
@@ -371,3 +599,33 @@ class BandersnatchExtendedPoint():
         if isinstance(other, BandersnatchExtendedPoint):
             return BandersnatchExtendedPoint.equal(self, other)
         raise TypeError("can only check if a Point is equal to a Point")
+
+
+# A point with z = 1, which also stores x + y and D * t.
+#
+# These are the values of the second point that `add` would otherwise compute on every addition,
+# so points which are added many times, such as MSM bases and table entries,
+# are converted to this form once and added with `add_cached`.
+#
+# Curves with a = -1 usually cache (y + x, y - x, 2d * t, 2z) instead, but that trick relies on
+# a = -1 and bandersnatch has a = -5.
+@dataclass
+class BandersnatchCachedPoint():
+    __slots__ = ("x", "y", "t", "x_plus_y", "d_t")
+    x: Fp
+    y: Fp
+    t: Fp
+    x_plus_y: Fp
+    d_t: Fp
+
+    # `point` must have z = 1, see `BandersnatchExtendedPoint.batch_normalize`
+    def from_normalized(point: BandersnatchExtendedPoint):
+        assert point.z.is_one()
+        return BandersnatchCachedPoint(point.x, point.y, point.t, point.x + point.y, D * point.t)
+
+    def to_extended(self) -> BandersnatchExtendedPoint:
+        return BandersnatchExtendedPoint._from_coordinates(self.x, self.y, self.t, Fp.one())
+
+    def __neg__(self):
+        # -(x, y) = (-x, y)
+        return BandersnatchCachedPoint(-self.x, self.y, -self.t, self.y - self.x, -self.d_t)
@@ -1,5 +1,5 @@
 import unittest
-from .twedards import BandersnatchExtendedPoint
+from .twedards import BandersnatchAffinePoint, BandersnatchExtendedPoint, wnaf, SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF
 from .field_scalar import Fr
 
 
@@ -15,6 +15,58 @@ class TestBandersnatchTwedwardsMethods(unittest.TestCase):
 
         assert result_add == result_double
 
+    def test_double_not_normalized(self):
+        # Use a point with z != 1
+        gen = BandersnatchExtendedPoint.generator()
+        point = gen + gen + gen
+
+        result_add = point + point
+
+        result_double = BandersnatchExtendedPoint.identity()
+        result_double.double(point)
+
+        assert result_add == result_double
+
+        result_double.double(BandersnatchExtendedPoint.identity())
+        assert result_double.is_zero()
+
+    def test_affine_double(self):
+        gen = BandersnatchAffinePoint.generator()
+        result_add = gen + gen
+
+        result_double = BandersnatchAffinePoint.identity()
+        result_double.double(gen)
+
+        assert result_add == result_double
+
+    def test_batch_normalize(self):
+        gen = BandersnatchExtendedPoint.generator()
+        point = gen + gen
+        other = point + gen
+
+        normalized = BandersnatchExtendedPoint.batch_normalize([point, other])
+        for p in normalized:
+            assert p.z.is_one()
+
+        assert normalized[0] == point
+        assert normalized[1] == other
+
+    def test_add_cached(self):
+        gen = BandersnatchExtendedPoint.generator()
+        point = gen + gen
+        other = point + gen
+
+        cached = BandersnatchExtendedPoint.batch_to_cached([point])[0]
+
+        result = BandersnatchExtendedPoint.identity()
+        result.add_cached(other, cached)
+        assert result == other + point
+
+        result.add_cached(other, -cached)
+        assert result == other - point
+
+        assert cached.to_extended() == point
+
     def test_eq(self):
 
         gen = BandersnatchExtendedPoint.generator()
@@ -23,6 +75,18 @@ class TestBandersnatchTwedwardsMethods(unittest.TestCase):
         assert gen == gen
         assert gen != neg_gen
 
+    def test_is_on_curve_projective(self):
+        gen = BandersnatchExtendedPoint.generator()
+        point = gen + gen + gen
+        # The sum is not normalised
+        self.assertFalse(point.z.is_one())
+        self.assertTrue(point.is_on_curve())
+        self.assertTrue(BandersnatchExtendedPoint.identity().is_on_curve())
+
+        off_curve = point.dup()
+        off_curve.x = off_curve.x + off_curve.z
+        self.assertFalse(off_curve.is_on_curve())
+
     def test_neg(self):
 
         gen = BandersnatchExtendedPoint.generator()
@@ -72,6 +136,37 @@ class TestBandersnatchTwedwardsMethods(unittest.TestCase):
 
         assert "e951ad5d98e7181e99d76452e0e343281295e38d90c602bf824892fd86742c4a" == result.to_bytes().hex()
 
+    def test_wnaf_digits(self):
+        for width in [2, 3, 4, 5]:
+            for value in [0, 1, 7, 255, 2**128 + 3, -1 % 2**253]:
+                digits = wnaf(value, width)
+
+                got = sum(digit * 2**i for i, digit in enumerate(digits))
+                self.assertEqual(got, value)
+
+                for i, digit in enumerate(digits):
+                    if digit != 0:
+                        self.assertEqual(digit % 2, 1)
+                        self.assertLess(abs(digit), 2**(width - 1))
+                        # The next w-1 digits must be zero
+                        self.assertTrue(
+                            all(d == 0 for d in digits[i+1:i+width]))
+
+    def test_scalar_mul_methods(self):
+        gen = BandersnatchExtendedPoint.generator()
+        point = gen + gen + gen
+
+        for integer in [0, 1, 2, 3, 12345, 2**200 + 1, -1]:
+            scalar = Fr(integer)
+
+            expected = BandersnatchExtendedPoint.identity()
+            expected.scalar_mul(point, scalar, SCALAR_MUL_DOUBLE_AND_ADD)
+
+            got = BandersnatchExtendedPoint.identity()
+            got.scalar_mul(point, scalar, SCALAR_MUL_WNAF)
+
+            self.assertEqual(expected, got)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,14 +1,17 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from ..bandersnatch.field_base import Fp
-import copy
 from ..bandersnatch.field_scalar import Fr
-from typing import List
-from ..bandersnatch.twedards import BandersnatchAffinePoint, BandersnatchExtendedPoint, A as A_COEFF
+from typing import List, Optional, Tuple
+from ..bandersnatch.twedards import BandersnatchAffinePoint, BandersnatchExtendedPoint, A as A_COEFF, D as D_COEFF, SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_GLV
+from ..bandersnatch import twedards
+from ..bandersnatch.msm import pippenger, precompute_bases, straus_msm, STRAUS_MAX_TERMS
+from ..bandersnatch.glv import glv_scalar_mul
 
 
 @dataclass
 class Banderwagon():
+    __slots__ = ("point",)
     point: BandersnatchExtendedPoint
 
     def __init__(self, serialised_bytes_big_endian=None, unsafe_bandersnatch_point=None):
@@ -34,28 +37,39 @@ class Banderwagon():
 
     def __eq__(self, other):
         if isinstance(other, Banderwagon):
-            # The equals method is different for the quotient group
-            #
-            # Check for the (0,0) point, which is _possible_
-            # given that you do not need to use the constructor to construct points
-            x1 = self.point.x
-            y1 = self.point.y
-            x2 = other.point.x
-            y2 = other.point.y
-
-            if x1.is_zero() and y1.is_zero():
-                return False
-            if x2.is_zero() and y2.is_zero():
-                return False
-
-            lhs = x1 * y2
-            rhs = x2 * y1
-
-            return lhs == rhs
+            return Banderwagon.equal(self, other)
 
         raise TypeError(
             "It is only safe to check equality between Banderwagon points")
 
+    # The equals method is different for the quotient group.
+    # (x, y) and (-x, -y) are the same element, so we check x1/y1 == x2/y2.
+    # This is done with a cross multiplication, so the points are never normalised
+    def equal(p: Banderwagon, q: Banderwagon):
+        # Check for the (0,0) point, which is _possible_
+        # given that you do not need to use the constructor to construct points
+        x1 = p.point.x
+        y1 = p.point.y
+        x2 = q.point.x
+        y2 = q.point.y
+
+        if x1.is_zero() and y1.is_zero():
+            return False
+        if x2.is_zero() and y2.is_zero():
+            return False
+
+        lhs = x1 * y2
+        rhs = x2 * y1
+
+        return lhs == rhs
+
+    # The identity element is (0, 1) and (0, -1) in any projective co-ordinates,
+    # so this is the same as `self == Banderwagon.identity()` without any multiplications
+    def is_identity(self):
+        return self.point.x.is_zero() and not self.point.y.is_zero()
+
+    # Points are modified in place, so they are not hashable.
+    # Use the bytes of `to_bytes`, or of `batch_to_bytes` for many points, as dictionary keys
     def generator():
         return Banderwagon(None, BandersnatchExtendedPoint.generator())
 
@@ -72,36 +86,112 @@ class Banderwagon():
         return self
 
     def from_bytes(serialised_bytes_big_endian: bytes):
+        # Will error if the bytes are not canonical
+        x = Banderwagon._x_from_bytes(serialised_bytes_big_endian)
+        if x is None:
+            return None
+
+        # Will error if the point is not on the curve
+        # or if the x coordinate is not in the subgroup
+        roots = Banderwagon._y_coordinate_roots(x)
+        if roots is None:
+            return None
+        num_sqrt, den_sqrt = roots
+
+        y = Banderwagon._positive_y(num_sqrt / den_sqrt)
+        return (x, y)
+
+    # Same as `from_bytes` for many serialised points, except that it returns the points.
+    # Each point which fails to deserialise is returned as None, instead of raising.
+    # The divisions in the y co-ordinates share a single field inversion.
+    #
+    # If `processes` is more than one, the points are split between that many worker processes
+    def batch_from_bytes(list_of_bytes: List[bytes], processes=None) -> List[Optional[Banderwagon]]:
+        if processes is not None and processes > 1 and len(list_of_bytes) > 1:
+            # Imported here, since it is slow to import and most callers do not need it
+            from concurrent.futures import ProcessPoolExecutor
+            chunk_size = -(-len(list_of_bytes) // processes)
+            chunks = [list_of_bytes[i:i + chunk_size]
+                      for i in range(0, len(list_of_bytes), chunk_size)]
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                coordinates = [xy for chunk in executor.map(_batch_decompress, chunks)
+                               for xy in chunk]
+        else:
+            coordinates = _batch_decompress(list_of_bytes)
+
+        result = []
+        for xy in coordinates:
+            if xy is None:
+                result.append(None)
+                continue
+            x = Fp(xy[0])
+            y = Fp(xy[1])
+            point = BandersnatchExtendedPoint._from_coordinates(
+                x, y, x * y, Fp.one())
+            result.append(Banderwagon(None, point))
+        return result
+
+    def _x_from_bytes(serialised_bytes_big_endian: bytes):
         # banderwagon can only be instantiated with serialised bytes
         # TODO: we are still using big endian here, so we reverse
         serialised_bytes_little_endian = bytearray(serialised_bytes_big_endian)
         serialised_bytes_little_endian.reverse()
 
-        # Will error if the bytes are not canonical
-        x = Fp.from_bytes(serialised_bytes_little_endian)
-        if x is None:
+        return Fp.from_bytes(serialised_bytes_little_endian)
+
+    # Returns square roots of the numerator and the denominator of y^2 for `x`, or None if
+    # there is no point with this x co-ordinate or if it does not pass `subgroup_check`.
+    #
+    # y^2 = (1 - ax^2) / (1 - dx^2) and the subgroup check is the legendre symbol of 1 - ax^2.
+    # Taking the square roots of the numerator and the denominator separately gives us both
+    # with two square roots, instead of two legendre symbols and a square root
+    def _y_coordinate_roots(x: Fp):
+        x_sq = x * x
+        one = Fp.one()
+        num = one - A_COEFF * x_sq
+        den = one - D_COEFF * x_sq
+
+        num_sqrt, num_legendre = Fp.sqrt_with_legendre(num)
+        if num_legendre != 1:
             return None
 
-        # Will error if the point is not on the curve
-        y = BandersnatchAffinePoint.get_y_coordinate(x, True)
-        if y is None:
+        den_sqrt, den_legendre = Fp.sqrt_with_legendre(den)
+        if den_legendre != 1:
             return None
 
-        # Will error if x coordinate not a quadratic residue
-        if Banderwagon.subgroup_check(x) != 1:
-            return None
+        return num_sqrt, den_sqrt
 
-        return (x, y)
+    # Banderwagon points are deserialised with the y co-ordinate which is lexographically largest
+    def _positive_y(y: Fp):
+        if y.lexographically_largest():
+            return y
+        return -y
+
+    # Returns the positive y co-ordinate for `x`, or None if there is no point with
+    # this x co-ordinate or if it does not pass `subgroup_check`
+    def _get_y_coordinate_and_subgroup_check(x: Fp):
+        roots = Banderwagon._y_coordinate_roots(x)
+        if roots is None:
+            return None
+        num_sqrt, den_sqrt = roots
+        return Banderwagon._positive_y(num_sqrt / den_sqrt)
 
     def map_to_field_bytes(self):
         return self._map_to_field().to_bytes()
 
     def _map_to_field(self):
         # The map to field function for banderwagon is x/y
-        x = self.point.x.dup()
-        y = self.point.y.dup()
+        return self.point.x / self.point.y
+
+    # Same as `_map_to_field` for many points, using a single field inversion
+    def batch_map_to_field(points: List[Banderwagon]) -> List[Fp]:
+        if len(points) == 0:
+            return []
 
-        return x / y
+        # x/y is the same in projective co-ordinates, so we only need to invert y
+        y_invs = Fp.multi_inv([point.point.y for point in points])
+
+        return [point.point.x * y_inv for point, y_inv in zip(points, y_invs)]
 
     # TODO: change this to return true/false
     def subgroup_check(x: Fp):
@@ -116,8 +206,23 @@ class Banderwagon():
 
     def to_bytes(self):
         affine = self.point.to_affine()
-        x = affine.x.dup()
-        if affine.y.lexographically_largest() == False:
+        return Banderwagon._affine_to_bytes(affine.x, affine.y)
+
+    # Same as `to_bytes` for many points, using a single field inversion
+    def batch_to_bytes(points: List[Banderwagon]):
+        if len(points) == 0:
+            return []
+
+        z_invs = Fp.multi_inv([point.point.z for point in points])
+
+        result = []
+        for point, z_inv in zip(points, z_invs):
+            result.append(Banderwagon._affine_to_bytes(
+                point.point.x * z_inv, point.point.y * z_inv))
+        return result
+
+    def _affine_to_bytes(x: Fp, y: Fp):
+        if y.lexographically_largest() == False:
             x = -x
         bytes_little_endian = x.to_bytes()
 
@@ -131,13 +236,23 @@ class Banderwagon():
         return self
 
     def is_on_curve(self):
-        return self.point.to_affine().is_on_curve()
+        return self.point.is_on_curve()
 
     def dup(self):
-        return copy.deepcopy(self)
-
-    def scalar_mul(self, element, scalar: Fr):
-        self.point = element.point * scalar
+        return Banderwagon(None, self.point.dup())
+
+    # `method` defaults to the method set with `twedards.set_scalar_mul_method`
+    def scalar_mul(self, element, scalar: Fr, method=None):
+        if method is None:
+            method = twedards.scalar_mul_method
+
+        if method == SCALAR_MUL_GLV:
+            # The endomorphism can only be used because we are in the quotient group
+            self.point = glv_scalar_mul(
+                element.point, scalar, twedards.wnaf_width)
+        else:
+            self.point = BandersnatchExtendedPoint.identity().scalar_mul(
+                element.point, scalar, method)
         return self
 
     def identity():
@@ -148,11 +263,33 @@ class Banderwagon():
         return Banderwagon(None, BandersnatchExtendedPoint(affine_point))
 
     # Multi scalar multiplication
-    def msm(points: List[Banderwagon], scalars: List[Fr]):
+    # If `window_size` is None, it is chosen based on the number of points
+    # and a few terms are computed with the straus method instead of the bucket method
+    #
+    # `bases` is the result of `precompute_msm_bases(points)`, which can be passed
+    # instead of `points` when the same points are used many times
+    def msm(points: List[Banderwagon], scalars: List[Fr], window_size=None, bases=None):
+        if bases is None:
+            points = [point.point for point in points]
+        if window_size is None and len(scalars) <= STRAUS_MAX_TERMS:
+            result = straus_msm(points, scalars, glv=True, bases=bases)
+        else:
+            result = pippenger(points, scalars, window_size,
+                               glv=True, bases=bases)
+        return Banderwagon(None, result)
+
+    def precompute_msm_bases(points: List[Banderwagon]):
+        return precompute_bases([point.point for point in points], glv=True)
+
+    # Multi scalar multiplication by computing each term separately with double and add.
+    # This is only used to check the result of `msm` and `scalar_mul`
+    def msm_naive(points: List[Banderwagon], scalars: List[Fr]):
         res = Banderwagon.identity()
         for scalar, point in zip(scalars, points):
-            partial_res = point * scalar
-            res = res + partial_res
+            partial_res = BandersnatchExtendedPoint.identity()
+            partial_res.scalar_mul(point.point, scalar,
+                                   SCALAR_MUL_DOUBLE_AND_ADD)
+            res = res + Banderwagon(None, partial_res)
         return res
 
     # Method overloads
@@ -175,3 +312,38 @@ class Banderwagon():
         result = Banderwagon.identity()
         result.scalar_mul(self, other)
         return result
+
+
+# Deserialises the x and y co-ordinates of each point, see `Banderwagon.batch_from_bytes`.
+# The co-ordinates are returned as integers, which are cheap to send between processes.
+#
+# This is a module level function, so that it can be used by a process pool
+def _batch_decompress(list_of_bytes: List[bytes]) -> List[Optional[Tuple[int, int]]]:
+    xs = []
+    num_sqrts = []
+    den_sqrts = []
+    for serialised in list_of_bytes:
+        x = None
+        if len(serialised) == 32:
+            x = Banderwagon._x_from_bytes(serialised)
+
+        roots = None if x is None else Banderwagon._y_coordinate_roots(x)
+        if roots is None:
+            xs.append(None)
+            continue
+        xs.append(x)
+        num_sqrts.append(roots[0])
+        den_sqrts.append(roots[1])
+
+    den_sqrt_invs = Fp.multi_inv(den_sqrts) if len(den_sqrts) > 0 else []
+
+    result = []
+    i = 0
+    for x in xs:
+        if x is None:
+            result.append(None)
+            continue
+        y = Banderwagon._positive_y(num_sqrts[i] * den_sqrt_invs[i])
+        result.append((x.value, y.value))
+        i += 1
+    return result
@@ -1,5 +1,8 @@
 import unittest
-from .banderwagon import Banderwagon
+from .banderwagon import Banderwagon, Fr
+from ..bandersnatch.field_base import Fp
+from ..bandersnatch import twedards
+from ..bandersnatch.twedards import BandersnatchAffinePoint, BandersnatchExtendedPoint, set_scalar_mul_method, SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF, SCALAR_MUL_GLV
 
 
 class TestBanderwagon(unittest.TestCase):
@@ -46,6 +49,52 @@ class TestBanderwagon(unittest.TestCase):
 
             self.assertEqual(decoded_point, expected_point)
 
+    def test_y_coordinate_and_subgroup_check(self):
+        # Compare against computing the y co-ordinate and the subgroup check separately
+        for i in range(64):
+            x = Fp(i * 0x1234567890abcdef)
+
+            got = Banderwagon._get_y_coordinate_and_subgroup_check(x)
+
+            expected = BandersnatchAffinePoint.get_y_coordinate(x, True)
+            if Banderwagon.subgroup_check(x) != 1:
+                expected = None
+            self.assertEqual(got, expected)
+
+    def test_batch_from_bytes(self):
+        points = []
+        point = Banderwagon.generator()
+        for _ in range(8):
+            points.append(point.dup())
+            point.double(point)
+        serialised = [bytes(byts) for byts in Banderwagon.batch_to_bytes(points)]
+
+        not_canonical = bytes([0xff] * 32)
+        not_in_subgroup = None
+        for i in range(64):
+            x = Fp(i)
+            if BandersnatchAffinePoint.get_y_coordinate(x, True) is not None and Banderwagon.subgroup_check(x) != 1:
+                not_in_subgroup = bytes(reversed(x.to_bytes()))
+                break
+        self.assertIsNotNone(not_in_subgroup)
+        self.assertIsNone(Banderwagon.from_bytes(not_in_subgroup))
+
+        invalid = [not_canonical, not_in_subgroup, bytes(31)]
+        list_of_bytes = serialised[:4] + invalid + serialised[4:]
+        expected = points[:4] + [None] * len(invalid) + points[4:]
+
+        for processes in [None, 2]:
+            got = Banderwagon.batch_from_bytes(list_of_bytes, processes)
+
+            self.assertEqual(len(got), len(expected))
+            for got_point, expected_point in zip(got, expected):
+                if expected_point is None:
+                    self.assertIsNone(got_point)
+                else:
+                    self.assertEqual(got_point, expected_point)
+
+        self.assertEqual(Banderwagon.batch_from_bytes([]), [])
+
     def test_two_torsion(self):
         # two points which differ by the order two point (0,-1) should be
         # considered the same
@@ -57,6 +106,105 @@ class TestBanderwagon(unittest.TestCase):
 
         self.assertEqual(result, gen)
 
+    def test_dictionary_keys(self):
+        gen = Banderwagon.generator()
+        # The same element, with the co-ordinates negated
+        equivalent = Banderwagon(None, BandersnatchExtendedPoint._from_coordinates(
+            -gen.point.x, -gen.point.y, gen.point.t, gen.point.z))
+        self.assertEqual(equivalent, gen)
+
+        # Points are mutable, so they are keyed by their serialisation
+        with self.assertRaises(TypeError):
+            hash(gen)
+
+        coefficients = {bytes(gen.to_bytes()): 1}
+        coefficients[bytes(equivalent.to_bytes())] += 1
+        self.assertEqual(len(coefficients), 1)
+        self.assertEqual(coefficients[bytes(gen.to_bytes())], 2)
+
+        keys = [bytes(key) for key in Banderwagon.batch_to_bytes([gen, equivalent])]
+        self.assertEqual(len(set(keys)), 1)
+
+    def test_is_identity(self):
+        gen = Banderwagon.generator()
+
+        self.assertTrue(Banderwagon.identity().is_identity())
+        self.assertTrue((gen - gen).is_identity())
+        # The two torsion point is the identity in the quotient group
+        self.assertTrue(Banderwagon.two_torsion_point().is_identity())
+        self.assertFalse(gen.is_identity())
+        self.assertFalse((gen + gen).is_identity())
+
+    def test_dup(self):
+        gen = Banderwagon.generator()
+        copy = gen.dup()
+        copy.double(copy)
+
+        self.assertEqual(gen, Banderwagon.generator())
+        self.assertEqual(copy, gen + gen)
+
+    def test_msm(self):
+        # Check the bucket method against computing each term separately
+        points = []
+        point = Banderwagon.generator()
+        for _ in range(8):
+            points.append(point.dup())
+            point.double(point)
+
+        scalars = [Fr(-1), Fr(0), Fr(1), Fr(2**128 + 5),
+                   Fr(3), Fr(-2**200), Fr(12345), Fr(2**252)]
+
+        expected = Banderwagon.msm_naive(points, scalars)
+        for window_size in [None, 1, 3, 8]:
+            got = Banderwagon.msm(points, scalars, window_size)
+            self.assertEqual(got, expected)
+
+        # Bases may be longer than the scalars
+        bases = Banderwagon.precompute_msm_bases(points + points[:2])
+        got = Banderwagon.msm(None, scalars, bases=bases)
+        self.assertEqual(got, expected)
+
+        self.assertEqual(Banderwagon.msm([], []), Banderwagon.identity())
+
+    def test_scalar_mul_methods(self):
+        point = Banderwagon.generator() + Banderwagon.two_torsion_point()
+        scalars = [Fr(0), Fr(1), Fr(-1), Fr(2**128 + 5), Fr(-2**200)]
+        expected = [Banderwagon.msm_naive([point], [scalar])
+                    for scalar in scalars]
+
+        for method in [SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF, SCALAR_MUL_GLV]:
+            for scalar, want in zip(scalars, expected):
+                got = Banderwagon.identity().scalar_mul(point, scalar, method)
+                self.assertEqual(got, want)
+
+        # The method set with `set_scalar_mul_method` is used by default
+        old_method, old_width = twedards.scalar_mul_method, twedards.wnaf_width
+        try:
+            for method in [SCALAR_MUL_DOUBLE_AND_ADD, SCALAR_MUL_WNAF, SCALAR_MUL_GLV]:
+                for width in [2, 5]:
+                    set_scalar_mul_method(method, width)
+                    for scalar, want in zip(scalars, expected):
+                        self.assertEqual(point * scalar, want)
+        finally:
+            set_scalar_mul_method(old_method, old_width)
+
+    def test_batch_serialise(self):
+        points = [Banderwagon.identity()]
+        point = Banderwagon.generator()
+        for _ in range(5):
+            point = point + point + Banderwagon.two_torsion_point()
+            points.append(point)
+
+        got_bytes = Banderwagon.batch_to_bytes(points)
+        got_fields = Banderwagon.batch_map_to_field(points)
+
+        self.assertEqual(len(got_bytes), len(points))
+        for point, byts, field in zip(points, got_bytes, got_fields):
+            self.assertEqual(point.to_bytes(), byts)
+            self.assertEqual(point.map_to_field_bytes(), field.to_bytes())
+
+        self.assertEqual(Banderwagon.batch_to_bytes([]), [])
+
 
 if __name__ == '__main__':
     unittest.main()
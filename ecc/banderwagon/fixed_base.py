@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import List
+from .banderwagon import Banderwagon
+from ..bandersnatch.field_scalar import Fr, SCALAR_FIELD
+from ..bandersnatch.twedards import BandersnatchExtendedPoint, BandersnatchCachedPoint
+
+# Number of bits needed to represent a reduced scalar
+SCALAR_BITS = SCALAR_FIELD.bit_length()
+
+DEFAULT_WINDOW_SIZE = 8
+
+
+# Precomputed multiples of a point which never changes, such as a CRS basis point.
+#
+# The scalar is split into windows of `window_size` bits and for each window `i`
+# we store k * 2^(i * window_size) * P for every non-zero digit k.
+# A scalar multiplication is then one table lookup and one addition per window, with no doublings.
+class FixedBaseTable():
+    # `precomputed_table` is used to load a table which was built previously, see crs/cache.py
+    # In that case `point` is not used and every entry must be in cached form
+    def __init__(self, point: Banderwagon, window_size=DEFAULT_WINDOW_SIZE, precomputed_table=None):
+        assert window_size >= 1
+        self.window_size = window_size
+
+        # table[i][k-1] = k * 2^(i * window_size) * point
+        self.table: List[List[BandersnatchCachedPoint]] = []
+
+        if precomputed_table is not None:
+            assert len(precomputed_table) == FixedBaseTable.num_windows(
+                window_size)
+            self.table = precomputed_table
+            return
+
+        num_digits = (1 << window_size) - 1
+        base = point.point.dup()
+        for _ in range(FixedBaseTable.num_windows(window_size)):
+            row = [base.dup()]
+            for _ in range(num_digits - 1):
+                row.append(row[-1] + base)
+            # The base for the next window is 2^window_size * base
+            base = row[-1] + base
+            # Every entry is added many times, so they are stored in cached form
+            self.table.append(BandersnatchExtendedPoint.batch_to_cached(row))
+
+    def num_windows(window_size):
+        return -(-SCALAR_BITS // window_size)
+
+    # Number of points stored in a table, this can be used to estimate the memory
+    # needed before building tables for every basis point
+    def num_entries(window_size):
+        return FixedBaseTable.num_windows(window_size) * ((1 << window_size) - 1)
+
+    def mul(self, scalar: Fr) -> Banderwagon:
+        value = scalar.value
+        mask = (1 << self.window_size) - 1
+
+        result = BandersnatchExtendedPoint.identity()
+        for row in self.table:
+            digit = value & mask
+            if digit != 0:
+                result.add_cached(result, row[digit - 1])
+            value >>= self.window_size
+
+        return Banderwagon(None, result)
@@ -1 +1,3 @@
-from .field import Field
+from .field import Field, FieldElement
+from .prime_field import PrimeField
+from .field_vector import FieldVector
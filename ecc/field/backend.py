@@ -0,0 +1,86 @@
+import os
+
+# The integer backend used for modular inversion, exponentiation and legendre symbols.
+#
+# Field elements always store python integers, the backend only replaces these operations.
+# gmpy2 is used when it is installed, unless the environment variable VERKLE_FIELD_BACKEND
+# or `set_backend` selects a different backend. Both backends give the same results.
+#
+# The operations are looked up on this module at every call, for example `backend.invert(a, p)`,
+# so that changing the backend affects code which has already imported it.
+BACKEND_INT = "int"
+BACKEND_GMPY2 = "gmpy2"
+
+BACKEND_ENV_VAR = "VERKLE_FIELD_BACKEND"
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+def _int_invert(a, p):
+    return pow(a, -1, p)
+
+
+def _int_powmod(a, exponent, p):
+    return pow(a, exponent, p)
+
+
+def _int_legendre(a, p):
+    # Euler's criterion
+    ls = pow(a, (p - 1) // 2, p)
+    return -1 if ls == p - 1 else ls
+
+
+def _gmpy2_invert(a, p):
+    return int(gmpy2.invert(a, p))
+
+
+def _gmpy2_powmod(a, exponent, p):
+    return int(gmpy2.powmod(a, exponent, p))
+
+
+def _gmpy2_legendre(a, p):
+    # The jacobi symbol is the legendre symbol, since p is prime
+    return int(gmpy2.jacobi(a, p))
+
+
+backend = None
+invert = None
+powmod = None
+legendre = None
+
+
+def gmpy2_available():
+    return gmpy2 is not None
+
+
+# Selects the backend by name. If `name` is None, the environment variable is used
+# and gmpy2 is picked when it is installed, falling back to python integers otherwise.
+# Selecting gmpy2 by name errors if it is not installed
+def set_backend(name=None):
+    global backend, invert, powmod, legendre
+
+    if name is None:
+        name = os.environ.get(BACKEND_ENV_VAR) or BACKEND_GMPY2
+        if name == BACKEND_GMPY2 and not gmpy2_available():
+            name = BACKEND_INT
+
+    if name == BACKEND_INT:
+        invert, powmod, legendre = _int_invert, _int_powmod, _int_legendre
+    elif name == BACKEND_GMPY2:
+        if not gmpy2_available():
+            raise Exception("gmpy2 backend selected, but gmpy2 is not installed")
+        invert, powmod, legendre = _gmpy2_invert, _gmpy2_powmod, _gmpy2_legendre
+    else:
+        raise Exception("unknown field backend", name)
+
+    backend = name
+
+
+def get_backend():
+    return backend
+
+
+set_backend()
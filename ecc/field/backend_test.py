@@ -0,0 +1,56 @@
+import unittest
+from . import backend
+from .field import Field
+
+MODULUS = 13108968793781547619861935127046491459309155893440570251786403306729687672801
+
+
+class TestFieldBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.previous_backend = backend.get_backend()
+
+    def tearDown(self):
+        backend.set_backend(self.previous_backend)
+
+    def compute(self):
+        results = []
+        for value in [1, 2, 3, 12345, MODULUS - 1]:
+            a = Field(value, MODULUS)
+            inverse = Field(0, MODULUS).inv(a)
+            root = Field(0, MODULUS).sqrt(a)
+            results.append((inverse.value, a.legendre(),
+                            None if root is None else root.value,
+                            Field(0, MODULUS).exp(a, MODULUS - 2).value))
+        return results
+
+    def test_int_backend(self):
+        backend.set_backend(backend.BACKEND_INT)
+        self.assertEqual(backend.get_backend(), backend.BACKEND_INT)
+
+        for inverse, legendre, root, exp in self.compute():
+            self.assertEqual(inverse, exp)
+            self.assertIn(legendre, [-1, 1])
+            self.assertEqual(root is None, legendre == -1)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception):
+            backend.set_backend("unknown")
+
+    @unittest.skipIf(backend.gmpy2_available(), "gmpy2 is installed")
+    def test_gmpy2_not_installed(self):
+        with self.assertRaises(Exception):
+            backend.set_backend(backend.BACKEND_GMPY2)
+        self.assertEqual(backend.get_backend(), self.previous_backend)
+
+    @unittest.skipUnless(backend.gmpy2_available(), "gmpy2 is not installed")
+    def test_backends_agree(self):
+        backend.set_backend(backend.BACKEND_INT)
+        expected = self.compute()
+
+        backend.set_backend(backend.BACKEND_GMPY2)
+        self.assertEqual(expected, self.compute())
+
+
+if __name__ == '__main__':
+    unittest.main()
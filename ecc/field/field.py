@@ -1,9 +1,20 @@
-import copy
+from . import backend
+
+# The base of `Field` and `PrimeField`, which only stores the value.
+# Subclasses provide the modulus, so prime field elements do not need a slot for it
+class FieldElement():
+    __slots__ = ("value",)
+
+    def string(self):
+        return str(self.value)
+
 
 # A generic implementation of a field element
 
 
-class Field():
+class Field(FieldElement):
+    __slots__ = ("modulus",)
+
     def __init__(self, value, modulus):
         self.value = value % modulus
         self.modulus = modulus
@@ -48,9 +59,6 @@ class Field():
     def lexographically_largest(x, q_min_one_div_2):
         return x.value > q_min_one_div_2
 
-    def string(self):
-        return str(self.value)
-
     def add(self, a, b):
         self._check_all_integers_same_modulus(a, b)
         self.value = (a.value + b.value) % self.modulus
@@ -80,13 +88,13 @@ class Field():
         return self.value == b.value
 
     def dup(self):
-        return copy.deepcopy(self)
+        return Field(self.value, self.modulus)
 
     def inv(self, a):
         if a.is_zero():
             return None
         self._check_all_integers_same_modulus(a, a)
-        self.value = pow(a.value, -1, self.modulus)
+        self.value = backend.invert(a.value, self.modulus)
         return self
 
     # TODO: Clean this up to be more readable
@@ -120,7 +128,7 @@ class Field():
 
     def exp(self, a, exponent):
         self._check_all_integers_same_modulus(a, a)
-        self.value = pow(a.value, exponent, self.modulus)
+        self.value = backend.powmod(a.value, exponent, self.modulus)
         return self
 
     def legendre(self):
@@ -162,7 +170,7 @@ class Field():
         return result
 
     def __eq__(self, obj):
-        assert(isinstance(obj, Field))
+        assert(isinstance(obj, FieldElement))
         return self.equal(obj)
 
 
@@ -196,7 +204,7 @@ def modular_sqrt(a, p):
     elif p == 2:
         return 0
     elif p % 4 == 3:
-        return pow(a, (p + 1) // 4, p)
+        return backend.powmod(a, (p + 1) // 4, p)
 
     # Partition p-1 to s * 2^e for an odd s (i.e.
     # reduce all the powers of 2 from p-1)
@@ -229,9 +237,9 @@ def modular_sqrt(a, p):
     # both a and b
     # r is the exponent - decreases with each update
     #
-    x = pow(a, (s + 1) // 2, p)
-    b = pow(a, s, p)
-    g = pow(n, s, p)
+    x = backend.powmod(a, (s + 1) // 2, p)
+    b = backend.powmod(a, s, p)
+    g = backend.powmod(n, s, p)
     r = e
 
     while True:
@@ -245,7 +253,7 @@ def modular_sqrt(a, p):
         if m == 0:
             return x
 
-        gs = pow(g, 2 ** (r - m - 1), p)
+        gs = backend.powmod(g, 2 ** (r - m - 1), p)
         g = (gs * gs) % p
         x = (x * gs) % p
         b = (b * g) % p
@@ -261,5 +269,4 @@ def legendre_symbol(a, p):
         Returns 1 if a has a square root modulo
         p, -1 otherwise.
     """
-    ls = pow(a, (p - 1) // 2, p)
-    return -1 if ls == p - 1 else ls
+    return backend.legendre(a, p)
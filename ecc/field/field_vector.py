@@ -0,0 +1,161 @@
+from typing import List
+from .prime_field import PrimeField
+
+# NumPy is optional. With NumPy, the values are stored in an object array, so that each
+# operation on the vector is a single array expression with one reduction at the end.
+# Without it, the same operations run over a list of python integers.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def numpy_available():
+    return np is not None
+
+
+def _to_array(values):
+    if np is None:
+        return list(values)
+    return np.array(list(values), dtype=object)
+
+
+# A vector of elements of a `PrimeField` subclass, such as Fr.
+#
+# Elements are stored as reduced integers rather than field element objects,
+# so polynomial wide operations do not allocate an object per element and per operation.
+class FieldVector():
+    __slots__ = ("field", "values")
+
+    def __init__(self, field, values):
+        # The field element type, for example Fr
+        self.field = field
+        # Reduced integers, see `_to_array`
+        self.values = values
+
+    def from_list(elements, field=None):
+        if field is None:
+            field = type(elements[0])
+        return FieldVector(field, _to_array(element.value for element in elements))
+
+    # `values` are integers which are already reduced
+    def from_ints(field, values: List[int]):
+        return FieldVector(field, _to_array(values))
+
+    def zero(field, length: int):
+        return FieldVector(field, _to_array([0] * length))
+
+    def to_list(self) -> List:
+        field = self.field
+        return [PrimeField._from_reduced(field, int(value)) for value in self.values]
+
+    def __len__(self):
+        return len(self.values)
+
+    # A slice is a copy with both backends, so modifying it does not change this vector
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FieldVector(self.field, _to_array(self.values[index]))
+        return PrimeField._from_reduced(self.field, int(self.values[index]))
+
+    def dup(self):
+        return FieldVector(self.field, _to_array(self.values))
+
+    def add(self, a, b):
+        p = self.field.MODULUS
+        if np is None:
+            self.values = [(x + y) % p for x, y in zip(a.values, b.values)]
+        else:
+            self.values = (a.values + b.values) % p
+        return self
+
+    def sub(self, a, b):
+        p = self.field.MODULUS
+        if np is None:
+            self.values = [(x - y) % p for x, y in zip(a.values, b.values)]
+        else:
+            self.values = (a.values - b.values) % p
+        return self
+
+    # Elementwise multiplication
+    def mul(self, a, b):
+        p = self.field.MODULUS
+        if np is None:
+            self.values = [x * y % p for x, y in zip(a.values, b.values)]
+        else:
+            self.values = (a.values * b.values) % p
+        return self
+
+    def scale(self, a, scalar):
+        p = self.field.MODULUS
+        scalar = scalar.value
+        if np is None:
+            self.values = [x * scalar % p for x in a.values]
+        else:
+            self.values = (a.values * scalar) % p
+        return self
+
+    # Computes a[i] + b[i] * scalar
+    # This is used both to accumulate scaled polynomials and to fold vectors in half
+    def add_scaled(self, a, b, scalar):
+        p = self.field.MODULUS
+        scalar = scalar.value
+        if np is None:
+            self.values = [(x + y * scalar) % p for x, y in zip(a.values, b.values)]
+        else:
+            self.values = (a.values + b.values * scalar) % p
+        return self
+
+    # Computes acc[i] + a[i] * b[i] * scalar
+    def add_mul_scaled(self, acc, a, b, scalar):
+        p = self.field.MODULUS
+        scalar = scalar.value
+        if np is None:
+            self.values = [(x + y * z % p * scalar) % p
+                           for x, y, z in zip(acc.values, a.values, b.values)]
+        else:
+            self.values = (acc.values + (a.values * b.values % p) * scalar) % p
+        return self
+
+    # Adds `value` to the element at `index`. Unlike the other methods, this modifies the values in place
+    def add_at(self, index: int, value):
+        p = self.field.MODULUS
+        self.values[index] = (int(self.values[index]) + value.value) % p
+        return self
+
+    # Computes c[i] = left[i] + right[i] * challenge, where left and right are the two halves of the vector
+    def fold(self, challenge):
+        assert len(self) % 2 == 0
+        mid = len(self) // 2
+        # The halves are only read, so they do not need to be copied like a slice
+        left = FieldVector(self.field, self.values[:mid])
+        right = FieldVector(self.field, self.values[mid:])
+        return FieldVector(self.field, None).add_scaled(left, right, challenge)
+
+    # The products are summed as integers and reduced once
+    def inner_product(self, other):
+        assert len(self) == len(other)
+        if np is None:
+            result = sum(x * y for x, y in zip(self.values, other.values))
+        else:
+            result = int(np.dot(self.values, other.values)) if len(self) > 0 else 0
+        return PrimeField._from_reduced(self.field, result % self.field.MODULUS)
+
+    def equal(self, other):
+        return self.field is other.field and [int(x) for x in self.values] == [int(y) for y in other.values]
+
+    # Method overloads
+    def __add__(self, other):
+        return FieldVector(self.field, None).add(self, other)
+
+    def __sub__(self, other):
+        return FieldVector(self.field, None).sub(self, other)
+
+    def __mul__(self, other):
+        if isinstance(other, FieldVector):
+            return FieldVector(self.field, None).mul(self, other)
+        return FieldVector(self.field, None).scale(self, other)
+
+    def __eq__(self, other):
+        assert(isinstance(other, FieldVector))
+        return self.equal(other)
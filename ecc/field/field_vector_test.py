@@ -0,0 +1,71 @@
+import unittest
+from ecc import Fr
+from .field_vector import FieldVector
+
+
+def elements(values):
+    return [Fr(value) for value in values]
+
+
+class TestFieldVector(unittest.TestCase):
+
+    def test_list_round_trip(self):
+        values = elements([0, 1, 2, Fr.MODULUS - 1])
+
+        vector = FieldVector.from_list(values)
+
+        self.assertEqual(vector.to_list(), values)
+        self.assertEqual(len(vector), 4)
+        self.assertEqual(vector[3], Fr(-1))
+
+    def test_slice(self):
+        vector = FieldVector.from_list(elements([1, 2, 3, 4]))
+
+        # Slices are copies
+        tail = vector[2:]
+        tail.add_at(0, Fr(10))
+
+        self.assertEqual(tail.to_list(), elements([13, 4]))
+        self.assertEqual(vector.to_list(), elements([1, 2, 3, 4]))
+
+    def test_arithmetic(self):
+        a = elements([1, 2, 3, 4])
+        b = elements([5, 6, 7, -8])
+        scalar = Fr(-3)
+        vec_a = FieldVector.from_list(a)
+        vec_b = FieldVector.from_list(b)
+
+        self.assertEqual((vec_a + vec_b).to_list(),
+                         [x + y for x, y in zip(a, b)])
+        self.assertEqual((vec_a - vec_b).to_list(),
+                         [x - y for x, y in zip(a, b)])
+        self.assertEqual((vec_a * vec_b).to_list(),
+                         [x * y for x, y in zip(a, b)])
+        self.assertEqual((vec_a * scalar).to_list(), [x * scalar for x in a])
+
+        got = FieldVector.zero(Fr, 4).add_scaled(vec_a, vec_b, scalar)
+        self.assertEqual(got.to_list(), [x + y * scalar for x, y in zip(a, b)])
+
+    def test_inner_product(self):
+        a = elements([1, 2, 3, -4])
+        b = elements([5, 6, 7, 8])
+
+        expected = Fr.zero()
+        for x, y in zip(a, b):
+            expected += x * y
+
+        got = FieldVector.from_list(a).inner_product(FieldVector.from_list(b))
+
+        self.assertEqual(got, expected)
+
+    def test_fold(self):
+        a = elements([1, 2, 3, 4])
+        challenge = Fr(10)
+
+        got = FieldVector.from_list(a).fold(challenge)
+
+        self.assertEqual(got.to_list(), [Fr(31), Fr(42)])
+
+
+if __name__ == '__main__':
+    unittest.main()
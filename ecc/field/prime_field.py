@@ -0,0 +1,173 @@
+from . import backend
+from .field import FieldElement, modular_sqrt, legendre_symbol
+
+_new = object.__new__
+
+
+# A field element whose modulus is fixed by the subclass.
+#
+# This has the same API as `Field`, but it stores only the value, skips the checks
+# that both operands have the same modulus and does not allocate an intermediate
+# generic `Field` for every operation. Subclasses set MODULUS, BYTE_LEN and Q_MIN_ONE_DIV_2.
+class PrimeField(FieldElement):
+    __slots__ = ()
+
+    MODULUS = None
+    BYTE_LEN = None
+    # (p-1)/2
+    Q_MIN_ONE_DIV_2 = None
+
+    def __init__(self, value=None, generic_field=None):
+        if generic_field is not None:
+            assert generic_field.modulus == self.MODULUS
+            value = generic_field.value
+        self.value = value % self.MODULUS
+
+    @property
+    def modulus(self):
+        return self.MODULUS
+
+    # Creates an element of `cls` from a value which is already reduced
+    def _from_reduced(cls, value):
+        result = _new(cls)
+        result.value = value
+        return result
+
+    def _zero(cls):
+        return PrimeField._from_reduced(cls, 0)
+
+    def _one(cls):
+        return PrimeField._from_reduced(cls, 1)
+
+    def _from_bytes(cls, bytes_little_endian):
+        # Return None if the bytes are not in canonical form
+        value = int.from_bytes(bytes_little_endian, byteorder='little')
+        if value >= cls.MODULUS:
+            return None
+        return PrimeField._from_reduced(cls, value)
+
+    def _from_bytes_reduce(cls, bytes_little_endian):
+        value = int.from_bytes(bytes_little_endian, byteorder='little')
+        return PrimeField._from_reduced(cls, value % cls.MODULUS)
+
+    # Montgomery's trick, zero values are mapped to zero
+    def _multi_inv(cls, values):
+        modulus = cls.MODULUS
+
+        partials = [1]
+        for value in values:
+            partials.append(partials[-1] * (value.value or 1) % modulus)
+
+        inv = backend.invert(partials[-1], modulus)
+
+        outputs = [None] * len(values)
+        for i in range(len(values), 0, -1):
+            value = values[i-1].value
+            if value == 0:
+                outputs[i-1] = PrimeField._from_reduced(cls, 0)
+                continue
+            outputs[i-1] = PrimeField._from_reduced(
+                cls, partials[i-1] * inv % modulus)
+            inv = inv * value % modulus
+
+        return outputs
+
+    def is_constant(self, constant):
+        return self.value == constant
+
+    def is_zero(self):
+        return self.value == 0
+
+    def is_one(self):
+        return self.value == 1
+
+    def to_bytes(self):
+        return self.value.to_bytes(self.BYTE_LEN, byteorder='little')
+
+    def lexographically_largest(self):
+        return self.value > self.Q_MIN_ONE_DIV_2
+
+    def add(self, a, b):
+        self.value = (a.value + b.value) % self.MODULUS
+        return self
+
+    def sub(self, a, b):
+        self.value = (a.value - b.value) % self.MODULUS
+        return self
+
+    def neg(self, a):
+        self.value = -a.value % self.MODULUS
+        return self
+
+    def mul(self, a, b):
+        self.value = a.value * b.value % self.MODULUS
+        return self
+
+    def equal(self, b):
+        return self.value == b.value
+
+    def dup(self):
+        return PrimeField._from_reduced(type(self), self.value)
+
+    # Used by copy, deepcopy and pickle. The modulus belongs to the class, so only the value is stored
+    def __reduce__(self):
+        return (type(self), (self.value,))
+
+    def inv(self, a):
+        if a.value == 0:
+            return None
+        self.value = backend.invert(a.value, self.MODULUS)
+        return self
+
+    def sqrt(self, a):
+        value = modular_sqrt(a.value, self.MODULUS)
+        if value is None:
+            return None
+        self.value = value
+        return self
+
+    def exp(self, a, exponent):
+        self.value = backend.powmod(a.value, exponent, self.MODULUS)
+        return self
+
+    def legendre(self):
+        return legendre_symbol(self.value, self.MODULUS)
+
+    def div(self, a, b):
+        # Like `Field.div`, dividing by zero gives zero
+        if b.value == 0:
+            self.value = 0
+            return self
+        self.value = a.value * \
+            backend.invert(b.value, self.MODULUS) % self.MODULUS
+        return self
+
+    # Method overloads
+    def __add__(self, other):
+        result = _new(type(self))
+        result.value = (self.value + other.value) % self.MODULUS
+        return result
+
+    def __sub__(self, other):
+        result = _new(type(self))
+        result.value = (self.value - other.value) % self.MODULUS
+        return result
+
+    def __mul__(self, other):
+        result = _new(type(self))
+        result.value = self.value * other.value % self.MODULUS
+        return result
+
+    def __neg__(self):
+        result = _new(type(self))
+        result.value = -self.value % self.MODULUS
+        return result
+
+    def __truediv__(self, other):
+        result = _new(type(self))
+        result.div(self, other)
+        return result
+
+    def __eq__(self, obj):
+        assert(isinstance(obj, FieldElement))
+        return self.value == obj.value
@@ -0,0 +1,76 @@
+import copy
+import sys
+import unittest
+from .field import Field
+from .prime_field import PrimeField
+
+
+class F13(PrimeField):
+    __slots__ = ()
+
+    MODULUS = 13
+    BYTE_LEN = 1
+    Q_MIN_ONE_DIV_2 = 6
+
+
+class TestPrimeFieldMethods(unittest.TestCase):
+
+    def test_matches_generic_field(self):
+        for x in range(13):
+            for y in range(13):
+                a, b = F13(x), F13(y)
+                generic_a, generic_b = Field(x, 13), Field(y, 13)
+
+                self.assertEqual((a + b).value, (generic_a + generic_b).value)
+                self.assertEqual((a - b).value, (generic_a - generic_b).value)
+                self.assertEqual((a * b).value, (generic_a * generic_b).value)
+                self.assertEqual((a / b).value, (generic_a / generic_b).value)
+                self.assertEqual((-a).value, (-generic_a).value)
+
+    def test_result_type(self):
+        a = F13(3)
+        self.assertIsInstance(a * a, F13)
+        self.assertIsInstance(a.dup(), F13)
+        self.assertIsInstance(copy.deepcopy(a), F13)
+        self.assertFalse(hasattr(a, "__dict__"))
+
+    def test_only_value_is_stored(self):
+        a = F13(3)
+        slots = [slot for cls in type(a).__mro__
+                 for slot in getattr(cls, "__slots__", ())]
+        self.assertEqual(slots, ["value"])
+        self.assertLess(sys.getsizeof(a), sys.getsizeof(Field(3, 13)))
+
+    def test_generic_field_conversion(self):
+        a = F13(None, Field(20, 13))
+        self.assertEqual(a, F13(7))
+        self.assertEqual(a.modulus, 13)
+
+    def test_in_place(self):
+        a = F13(3)
+        b = F13(5)
+        result = F13(0)
+
+        self.assertIs(result.mul(a, b), result)
+        self.assertEqual(result, F13(2))
+
+        result.inv(result)
+        self.assertEqual(result, F13(7))
+        self.assertIsNone(result.inv(F13(0)))
+
+    def test_multi_inv(self):
+        values = [F13(1), F13(0), F13(3)]
+
+        got = PrimeField._multi_inv(F13, values)
+
+        self.assertEqual(got, [F13(1), F13(0), F13(9)])
+
+    def test_serialise(self):
+        self.assertEqual(PrimeField._from_bytes(F13, F13(5).to_bytes()), F13(5))
+        self.assertIsNone(PrimeField._from_bytes(F13, bytes([13])))
+        self.assertEqual(
+            PrimeField._from_bytes_reduce(F13, bytes([13])), F13(0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 
 from typing import List
 from ecc import Fr
+from ecc.field import FieldVector
 
 # TODO: Methods here may be moved into different modules in the future
 
@@ -8,9 +9,4 @@ from ecc import Fr
 # Take the inner product between two lists of field
 # elements
 def inner_product(a: List[Fr], b: List[Fr]) -> Fr:
-    result = Fr(0)
-    for a_i, b_i in zip(a, b):
-        term = Fr(0)
-        term.mul(a_i, b_i)
-        result.add(result, term)
-    return result
+    return FieldVector.from_list(a, Fr).inner_product(FieldVector.from_list(b, Fr))
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, List, Union
 
 from ecc import Banderwagon, Fr
+from ecc.field import FieldVector
 from .transcript import Transcript
-from .common import inner_product
 from crs import CRS
 
 
@@ -23,7 +23,7 @@ class ProverQuery:
     # If polynomial was in monomial basis
     # this would be <1, b, b^2, b^3, b^4,..., b^n>
     # TODO: Can we give this a better name?
-    point_evaluations: List[Fr]
+    point_evaluations: Union[List[Fr], FieldVector]
 
 
 @dataclass
@@ -40,7 +40,7 @@ class VerifierQuery:
     point: Fr
     # If polynomial was in monomial basis
     # this would be <1, b, b^2, b^3, b^4,..., b^n>
-    point_evaluations: List[Fr]
+    point_evaluations: Union[List[Fr], FieldVector]
 
     output_point: Fr
     # TODO: change this from typing.Any
@@ -56,9 +56,9 @@ def make_ipa_proof(crs: CRS, transcript: Transcript, query: ProverQuery):
     n = len(query.polynomial)
     m = n // 2
 
-    a = query.polynomial
-    b = query.point_evaluations
-    y = inner_product(a, b)
+    a = FieldVector.from_list(query.polynomial, Fr)
+    b = _as_vector(query.point_evaluations)
+    y = a.inner_product(b)
 
     proof = Proof([], [], Fr.zero())
 
@@ -78,25 +78,30 @@ def make_ipa_proof(crs: CRS, transcript: Transcript, query: ProverQuery):
         a_R = a[m:]
         b_L = b[:m]
         b_R = b[m:]
-        z_L = inner_product(a_R, b_L)
-        z_R = inner_product(a_L, b_R)
+        z_L = a_R.inner_product(b_L)
+        z_R = a_L.inner_product(b_R)
 
-        C_L: Banderwagon = varbase_commit(a_R, current_basis[:m]) + (q * z_L)
-        C_R: Banderwagon = varbase_commit(a_L, current_basis[m:]) + (q * z_R)
+        # q is folded into the multi scalar multiplication, so that the last rounds,
+        # which only have a few terms, are a single straus multiplication
+        C_L: Banderwagon = varbase_commit(
+            a_R.to_list() + [z_L], current_basis[:m] + [q])
+        C_R: Banderwagon = varbase_commit(
+            a_L.to_list() + [z_R], current_basis[m:] + [q])
 
         proof.L.append(C_L)
         proof.R.append(C_R)
 
-        transcript.append_point(C_L, b"L")
-        transcript.append_point(C_R, b"R")
+        C_L_bytes, C_R_bytes = Banderwagon.batch_to_bytes([C_L, C_R])
+        transcript.append_point_bytes(C_L_bytes, b"L")
+        transcript.append_point_bytes(C_R_bytes, b"R")
         x = transcript.challenge_scalar(b"x")
 
         xinv = Fr.zero()
         xinv.inv(x)
 
         # Compute updates for next round
-        a = [(v + x * w) for v, w in zip(a_L, a_R)]
-        b = [(v + xinv * w) for v, w in zip(b_L, b_R)]
+        a = a.fold(x)
+        b = b.fold(xinv)
 
         current_basis = [v + (w * xinv)
                          for v, w in zip(current_basis[:m], current_basis[m:])]
@@ -135,11 +140,16 @@ def check_ipa_proof(crs: CRS, transcript: Transcript, query: VerifierQuery):
     xs = []
     xinvs = []
 
+    # Serialise all of the L and R points with a single inversion
+    serialized = Banderwagon.batch_to_bytes(proof.L + proof.R)
+    serialized_L = serialized[:len(proof.L)]
+    serialized_R = serialized[len(proof.L):]
+
     while n > 1:
         C_L = proof.L[i]
         C_R = proof.R[i]
-        transcript.append_point(C_L, b"L")
-        transcript.append_point(C_R, b"R")
+        transcript.append_point_bytes(serialized_L[i], b"L")
+        transcript.append_point_bytes(serialized_R[i], b"R")
         x = transcript.challenge_scalar(b"x")
 
         x_inv = Fr.zero()
@@ -148,7 +158,8 @@ def check_ipa_proof(crs: CRS, transcript: Transcript, query: VerifierQuery):
         xs.append(x)
         xinvs.append(xinv)
 
-        current_commitment = current_commitment + (C_L * x) + (C_R * xinv)
+        current_commitment = current_commitment + \
+            varbase_commit([x, xinv], [C_L, C_R])
 
         n = m
         m = n // 2
@@ -157,14 +168,14 @@ def check_ipa_proof(crs: CRS, transcript: Transcript, query: VerifierQuery):
     # Do it the inefficient way
     current_basis = crs.BASIS_G
 
+    b = _as_vector(b)
     for i in range(len(xs)):
 
         G_L, G_R = split_points(current_basis)
-        b_L, b_R = split_scalars(b)
 
         x_inv = xinvs[i]
 
-        b = fold_scalars(b_L, b_R, x_inv)
+        b = b.fold(x_inv)
         current_basis = fold_points(G_L, G_R, x_inv)
 
     assert len(b) == len(current_basis)
@@ -174,9 +185,16 @@ def check_ipa_proof(crs: CRS, transcript: Transcript, query: VerifierQuery):
     G_0 = current_basis[0]
 
     # G[0] * a + (a * b) * Q;
-    got_commitment = G_0 * proof.a + q * (proof.a * b_0)
+    got_commitment = varbase_commit([proof.a, proof.a * b_0], [G_0, q])
+
+    return Banderwagon.equal(current_commitment, got_commitment)
+
 
-    return current_commitment == got_commitment
+# The point evaluations may be given as a list, or as the vector returned by `barycentric_formula_constants`
+def _as_vector(values) -> FieldVector:
+    if isinstance(values, FieldVector):
+        return values
+    return FieldVector.from_list(values, Fr)
 
 
 # Computes c[i] = a[i] + b[i] * challenge
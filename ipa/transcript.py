@@ -36,6 +36,15 @@ class Transcript():
         point_as_bytes = bytes(point.to_bytes())
         self.__append_bytes(point_as_bytes, label)
 
+    # Same as `append_point` for a point which has already been serialised.
+    # This allows callers to serialise many points at once with `Banderwagon.batch_to_bytes`
+    def append_point_bytes(self, point_as_bytes, label):
+        if len(point_as_bytes) != 32:
+            raise TypeError(
+                'Expected a 32 byte serialised point, but found {} bytes'.format(len(point_as_bytes)))
+
+        self.__append_bytes(bytes(point_as_bytes), label)
+
     # Produce a challenge based on what has been seen so far in the transcript
     def challenge_scalar(self, label):
         self.domain_sep(label)
@@ -107,6 +107,23 @@ class TestTranscript(unittest.TestCase):
         self.assertEqual("8c2dafe7c0aabfa9ed542bb2cbf0568399ae794fc44fdfd7dff6cc0e6144921c",
                          challenge.to_bytes().hex())
 
+    def test_append_point_bytes(self):
+        """
+            Test that appending a serialised point is the same as appending the point
+        """
+        generator = Banderwagon.generator()
+
+        transcript = Transcript(b"simple_protocol")
+        transcript.append_point(generator, b"generator")
+        expected = transcript.challenge_scalar(b"simple_challenge")
+
+        transcript = Transcript(b"simple_protocol")
+        serialised = Banderwagon.batch_to_bytes([generator])[0]
+        transcript.append_point_bytes(serialised, b"generator")
+        got = transcript.challenge_scalar(b"simple_challenge")
+
+        self.assertEqual(expected, got)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,14 @@
 from dataclasses import dataclass
 from typing import List
 from ecc import Banderwagon, Fr
+from ecc.field import FieldVector
 from polynomial.lagrange_basis import LagrangeBasis
 from ipa.transcript import Transcript
 # TODO: re-export the correct objects in dunder init
 # TODO: so we don't have ipa.ipa
 from ipa.ipa import ProverQuery as IPAProverQuery, VerifierQuery as IPAVerifierQuery, check_ipa_proof, make_ipa_proof, Proof as IPAProof
 from polynomial.precomputed_weights import PrecomputedWeights
-from .quotient import compute_quotient_inside_domain
+from .quotient import accumulate_quotient_inside_domain, evaluations_vector
 from crs import CRS
 
 
@@ -52,7 +53,7 @@ class MultiProof:
     crs: CRS
 
     def __init__(self, domain: List[Fr], crs: CRS) -> None:
-        self.precomp = PrecomputedWeights(domain)
+        self.precomp = PrecomputedWeights.cached(domain)
         self.crs = crs
 
     def make_multiproof(self, transcript: Transcript, queries: List[ProverQuery]):
@@ -61,33 +62,33 @@ class MultiProof:
         transcript.domain_sep(b"multiproof")
 
         # Add queries into transcript
-        for query in queries:
-            transcript.append_point(query.C, b"C")
+        serialized_Cs = Banderwagon.batch_to_bytes(
+            [query.C for query in queries])
+        for query, C_serialized in zip(queries, serialized_Cs):
+            transcript.append_point_bytes(C_serialized, b"C")
             transcript.append_scalar(query.z, b"z")
             transcript.append_scalar(query.y, b"y")
 
         # Generate challenge from queries
         r = transcript.challenge_scalar(b"r")
 
-        g = [Fr.zero()] * domain_size
+        # g = sum_i r^i * q_i, where q_i is the quotient for query i
+        g = FieldVector.zero(Fr, domain_size)
         power_of_r = Fr.one()
         for query in queries:
-            f = query.f
-            index = query.z
-            quotient = compute_quotient_inside_domain(self.precomp, f, index)
-            for i in range(domain_size):
-                g[i] += power_of_r * quotient[i]
+            accumulate_quotient_inside_domain(
+                self.precomp, query.f, query.z, power_of_r, g)
 
             power_of_r = power_of_r * r
 
-        D = self.crs.commit(g)
+        D = self.crs.commit(g.to_list())
         transcript.append_point(D, b"D")
 
         # Step 2: Compute h in evaluation form
 
         t = transcript.challenge_scalar(b"t")
 
-        h = [Fr.zero()] * domain_size
+        h = FieldVector.zero(Fr, domain_size)
         power_of_r = Fr.one()
 
         for query in queries:
@@ -96,20 +97,20 @@ class MultiProof:
             denominator_inv = Fr.zero()  # TODO expose Fr.inv method
             denominator_inv = denominator_inv.inv(
                 t - self.precomp.domain[index])
-            for i in range(domain_size):
-                h[i] += power_of_r * f[i] * denominator_inv
+            h.add_scaled(h, evaluations_vector(f),
+                         power_of_r * denominator_inv)
 
             power_of_r = power_of_r * r
 
-        h_minus_g = [(h[i] - g[i]) for i in range(domain_size)]
+        h_minus_g = h - g
 
         # Step 3: Evaluate and compute IPA proofs
 
-        E = self.crs.commit(h)
+        E = self.crs.commit(h.to_list())
         transcript.append_point(E, b"E")
 
         ipa_commitment = E - D
-        polynomial = h_minus_g
+        polynomial = h_minus_g.to_list()
         input_point = t
         input_point_vector = self.precomp.barycentric_formula_constants(
             input_point)
@@ -128,11 +129,13 @@ class MultiProof:
         D = proof.D
         ipa_proof = proof.ipa
 
-        for query in queries:
-            C_i = query.C
+        serialized_Cs = [bytes(C_serialized) for C_serialized in Banderwagon.batch_to_bytes(
+            [query.C for query in queries])]
+
+        for query, C_serialized in zip(queries, serialized_Cs):
             z_i = query.z
             y_i = query.y
-            transcript.append_point(C_i, b"C")
+            transcript.append_point_bytes(C_serialized, b"C")
             transcript.append_scalar(z_i, b"z")
             transcript.append_scalar(y_i, b"y")
 
@@ -143,28 +146,29 @@ class MultiProof:
         transcript.append_point(D, b"D")
         t = transcript.challenge_scalar(b"t")
 
+        # The coefficients of equal commitments are summed, so each one is only added once to E.
+        # Commitments are keyed by their serialisation, which was already computed for the transcript
         E_coefficients = {}
+        C_by_serialized = {}
         g_2_of_t = Fr.zero()
         power_of_r = Fr.one()
 
-        C_by_serialized = {}
-
-        for query in queries:
-            C = query.C
+        for query, C_serialized in zip(queries, serialized_Cs):
             z = query.z.value
             y = query.y
-            # TODO: clean this up, its not very readable
             E_coefficient = power_of_r / (t - self.precomp.domain[z])
-            C_serialized = bytes(C.to_bytes())
-            C_by_serialized[C_serialized] = C
-            E_coefficients[C_serialized] = E_coefficient if C_serialized not in E_coefficients \
-                else (E_coefficients[C_serialized] + E_coefficient)
+            if C_serialized in E_coefficients:
+                E_coefficients[C_serialized] = E_coefficients[C_serialized] + \
+                    E_coefficient
+            else:
+                E_coefficients[C_serialized] = E_coefficient
+                C_by_serialized[C_serialized] = query.C
             g_2_of_t += E_coefficient * y
 
             power_of_r = power_of_r * r
 
-        E = varbase_commit(E_coefficients.values(), [C_by_serialized[x]
-                                                     for x in E_coefficients.keys()])
+        E = varbase_commit(list(E_coefficients.values()),
+                           [C_by_serialized[C_serialized] for C_serialized in E_coefficients.keys()])
         transcript.append_point(E, b"E")
 
         # Step 3 (Check IPA proofs)
@@ -1,26 +1,45 @@
+from typing import List
 from ecc import Fr
+from ecc.field import FieldVector
 from polynomial.lagrange_basis import LagrangeBasis
 from polynomial.precomputed_weights import PrecomputedWeights
 
 
 # Previously named: compute_inner_quotient_in_evaluation_form
-def compute_quotient_inside_domain(precomp: PrecomputedWeights, f: LagrangeBasis, index: Fr):
-    domain_size = len(precomp.domain)
-    inverses = precomp.domain_inverses
-    Aprime_domain = precomp.Aprime_DOMAIN
-    Aprime_domain_inv = precomp.Aprime_DOMAIN_inv
-
+def compute_quotient_inside_domain(precomp: PrecomputedWeights, f: LagrangeBasis, index: Fr) -> List[Fr]:
+    quotient = FieldVector.zero(Fr, len(precomp.domain))
+    accumulate_quotient_inside_domain(
+        precomp, f, index, Fr.one(), quotient)
+    return quotient.to_list()
+
+
+# Adds scalar * q to `accumulator`, where q is the quotient computed by `compute_quotient_inside_domain`.
+#
+# With the weights from `precomp.quotient_weights(index)`:
+#   q[i] = (f[i] - y) * w[i] for i != index
+#   q[index] = sum_i (f[i] - y) * u[i] = <f, u> - y * sum(u)
+# where y = f[index]. Since w[index] is zero, scalar * q is added in two passes over the vectors
+def accumulate_quotient_inside_domain(precomp: PrecomputedWeights, f: LagrangeBasis, index: Fr, scalar: Fr, accumulator: FieldVector):
     # TODO: check that index is on domain
     index = index.value
-    q = [Fr.zero()] * domain_size
+    w, u, u_sum = precomp.quotient_weights(index)
+
+    f = evaluations_vector(f)
     y = f[index]
-    for i in range(domain_size):
-        if i != index:
-            q[i] = (f[i] - y) * inverses[i - index]
-            q[index] += (f[i] - y) * inverses[index - i] * \
-                Aprime_domain[index] * Aprime_domain_inv[i]
 
-    return q
+    accumulator.add_mul_scaled(accumulator, f, w, scalar)
+    accumulator.add_scaled(accumulator, w, -(y * scalar))
+    accumulator.add_at(index, (f.inner_product(u) - y * u_sum) * scalar)
+    return accumulator
+
+
+# f may be a LagrangeBasis, a vector or a list of evaluations
+def evaluations_vector(f) -> FieldVector:
+    if isinstance(f, FieldVector):
+        return f
+    if isinstance(f, LagrangeBasis):
+        return f.vector
+    return FieldVector.from_list(f, Fr)
 
 
 def compute_quotient_outside_domain(precomp: PrecomputedWeights, f: LagrangeBasis, z: Fr, y: Fr):
@@ -0,0 +1,54 @@
+import unittest
+from ecc import Fr
+from ecc.field import FieldVector
+from polynomial.lagrange_basis import LagrangeBasis
+from polynomial.precomputed_weights import PrecomputedWeights
+from .quotient import accumulate_quotient_inside_domain, compute_quotient_inside_domain
+
+
+# Divides f - f(index) by (X - index), one element at a time
+def naive_quotient(precomp, f, index):
+    inverses = precomp.domain_inverses
+    q = [Fr.zero()] * len(f)
+    y = f[index]
+    for i in range(len(f)):
+        if i != index:
+            q[i] = (f[i] - y) * inverses[i - index]
+            q[index] += (f[i] - y) * inverses[index - i] * \
+                precomp.Aprime_DOMAIN[index] * precomp.Aprime_DOMAIN_inv[i]
+    return q
+
+
+class TestQuotient(unittest.TestCase):
+
+    def test_quotient_inside_domain(self):
+        domain = [Fr(i) for i in range(16)]
+        precomp = PrecomputedWeights(domain)
+        f = [Fr(i * i * i - 7 * i + 3) for i in range(16)]
+
+        for index in [0, 1, 8, 15]:
+            got = compute_quotient_inside_domain(precomp, f, Fr(index))
+            self.assertEqual(got, naive_quotient(precomp, f, index))
+
+    def test_accumulate_quotient_inside_domain(self):
+        domain = [Fr(i) for i in range(16)]
+        precomp = PrecomputedWeights(domain)
+        fs = [[Fr(i * j + j) for i in range(16)] for j in range(3)]
+        indices = [2, 2, 13]
+        scalars = [Fr(1), Fr(5), Fr(-9)]
+
+        expected = [Fr.zero()] * 16
+        for f, index, scalar in zip(fs, indices, scalars):
+            quotient = naive_quotient(precomp, f, index)
+            expected = [x + q * scalar for x, q in zip(expected, quotient)]
+
+        accumulator = FieldVector.zero(Fr, 16)
+        for f, index, scalar in zip(fs, indices, scalars):
+            accumulate_quotient_inside_domain(
+                precomp, LagrangeBasis(f, domain), Fr(index), scalar, accumulator)
+
+        self.assertEqual(accumulator.to_list(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
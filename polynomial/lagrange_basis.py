@@ -1,14 +1,47 @@
-from dataclasses import dataclass
 from typing import List
 from ecc import Fr
-from copy import deepcopy
+from ecc.field import FieldVector
 from .monomial_basis import MonomialBasis
 
 
-@dataclass
+# Polynomials are compared by the tokens of their domains, so arithmetic does not need to
+# compare the domains element by element. A continuous domain is represented by a range,
+# which is compared by its start and its length. Other domains are represented by their values
+def _domain_token(domain: List[Fr]):
+    if len(domain) == 0:
+        return range(0)
+    start = domain[0].value
+    if all(x.value == start + i for i, x in enumerate(domain)):
+        return range(start, start + len(domain))
+    return tuple(x.value for x in domain)
+
+
+def _same_domain_token(lhs, rhs) -> bool:
+    return lhs is rhs or lhs == rhs
+
+
+# A polynomial in evaluation form.
+#
+# The evaluations are stored in a `FieldVector`. Arithmetic replaces the vector of the result
+# instead of modifying it, so vectors can be shared between polynomials without copying them.
+# Only `add_scaled` and `scale_inplace` change a polynomial in place, and these are also seen
+# by polynomials which share its vector, see `from_vector`
 class LagrangeBasis:
-    evaluations: List[Fr]
-    domain: List[Fr]
+    __slots__ = ("vector", "domain", "domain_token")
+
+    def __init__(self, evaluations: List[Fr], domain: List[Fr]):
+        self.vector = FieldVector.from_list(evaluations, Fr)
+        self.domain = domain
+        self.domain_token = _domain_token(domain)
+
+    # Wraps `vector` without copying it
+    def from_vector(vector: FieldVector, domain: List[Fr], domain_token=None):
+        result = LagrangeBasis.__new__(LagrangeBasis)
+        result.vector = vector
+        result.domain = domain
+        result.domain_token = _domain_token(
+            domain) if domain_token is None else domain_token
+        return result
 
     # An empty polynomial with no evaluations and no domain
     # This is useful because arithmetic methods require a `self`
@@ -16,42 +49,49 @@ class LagrangeBasis:
     def _empty():
         return LagrangeBasis([], [])
 
+    @property
+    def evaluations(self) -> List[Fr]:
+        return self.vector.to_list()
+
+    # The evaluations are new field elements, so they can be modified by the caller
     def values(self):
-        return deepcopy(self.evaluations)
+        return self.vector.to_list()
 
-    def __arithmetic_op(self, lhs, rhs, operation):
-        if lhs.domain != rhs.domain:
+    def _check_same_domain(lhs, rhs):
+        if not _same_domain_token(lhs.domain_token, rhs.domain_token):
             raise Exception(
                 "can only perform arithmetic operations on polynomials over the same domain")
 
-        result: List[Fr] = []
-        for lhs_i, rhs_i in zip(lhs.evaluations, rhs.evaluations):
-            result.append(operation(lhs_i, rhs_i))
-
-        self.evaluations = result
-        self.domain = lhs.domain
-
+    def _set_result(self, vector: FieldVector, poly):
+        self.vector = vector
+        self.domain = poly.domain
+        self.domain_token = poly.domain_token
         return self
 
     def add(self, lhs, rhs):
-        def add(x, y): return x + y
-        return self.__arithmetic_op(lhs, rhs, add)
+        LagrangeBasis._check_same_domain(lhs, rhs)
+        return self._set_result(lhs.vector + rhs.vector, lhs)
 
     def sub(self, lhs, rhs):
-        def sub(x, y): return x - y
-        return self.__arithmetic_op(lhs, rhs, sub)
+        LagrangeBasis._check_same_domain(lhs, rhs)
+        return self._set_result(lhs.vector - rhs.vector, lhs)
 
     def mul(self, lhs, rhs):
-        def mul(x, y): return x * y
-        return self.__arithmetic_op(lhs, rhs, mul)
+        LagrangeBasis._check_same_domain(lhs, rhs)
+        return self._set_result(lhs.vector * rhs.vector, lhs)
 
     def scale(self, poly, constant: Fr):
-        result: List[Fr] = []
-        for eval in poly.evaluations:
-            result.append(eval * constant)
+        return self._set_result(poly.vector * constant, poly)
 
-        self.evaluations = result
-        self.domain = poly.domain
+    # Computes self + other * scalar in place
+    def add_scaled(self, other, scalar: Fr):
+        LagrangeBasis._check_same_domain(self, other)
+        self.vector.add_scaled(self.vector, other.vector, scalar)
+        return self
+
+    def scale_inplace(self, scalar: Fr):
+        self.vector.scale(self.vector, scalar)
+        return self
 
     # TODO: we cannot add the type PrecomputedWeights because it
     # TODO: will trigger a circular import
@@ -109,10 +149,15 @@ class LagrangeBasis:
 
     def equal(self, other):
         assert(isinstance(other, LagrangeBasis))
-        for lhs_i, rhs_i in zip(self.evaluations, other.evaluations):
-            if lhs_i != rhs_i:
-                return False
-        return True
+        return _same_domain_token(self.domain_token, other.domain_token) and self.vector.equal(other.vector)
+
+    def __eq__(self, other):
+        if not isinstance(other, LagrangeBasis):
+            return NotImplemented
+        return self.equal(other)
+
+    def __repr__(self):
+        return "LagrangeBasis(evaluations={}, domain={})".format(self.evaluations, self.domain)
 
     def __add__(self, other):
         result = LagrangeBasis._empty()
@@ -137,4 +182,7 @@ class LagrangeBasis:
 
     def __getitem__(self, index: int):
         # This is essentially an "evaluate_inside_domain" function
-        return self.evaluations[index]
+        return self.vector[index]
+
+    def __len__(self):
+        return len(self.vector)
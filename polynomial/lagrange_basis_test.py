@@ -64,6 +64,52 @@ class TestLagrangeBasis(unittest.TestCase):
 
         self.assertEqual(expected_result, result)
 
+    def test_add_scaled_inplace(self):
+        domain = [Fr(0), Fr(1), Fr(2), Fr(3)]
+        a = Polynomial([Fr(1), Fr(2), Fr(3), Fr(4)], domain)
+        # An equal domain, which is a different list
+        b = Polynomial([Fr(5), Fr(6), Fr(7), Fr(8)],
+                       [Fr(0), Fr(1), Fr(2), Fr(3)])
+
+        a.add_scaled(b, Fr(2))
+        self.assertEqual(a, Polynomial(
+            [Fr(11), Fr(14), Fr(17), Fr(20)], domain))
+
+        a.scale_inplace(Fr(-1))
+        self.assertEqual(a.values(), [Fr(-11), Fr(-14), Fr(-17), Fr(-20)])
+
+        other_domain = [Fr(1), Fr(2), Fr(3), Fr(4)]
+        c = Polynomial([Fr(1), Fr(2), Fr(3), Fr(4)], other_domain)
+        with self.assertRaises(Exception):
+            a + c
+
+    def test_from_vector(self):
+        domain = [Fr(0), Fr(1), Fr(2)]
+        a = Polynomial([Fr(1), Fr(2), Fr(3)], domain)
+
+        # The view shares the evaluations of `a`
+        view = Polynomial.from_vector(a.vector, domain)
+        a.scale_inplace(Fr(2))
+        self.assertEqual(view[2], Fr(6))
+
+        # Arithmetic results do not share them
+        result = a + view
+        a.scale_inplace(Fr(0))
+        self.assertEqual(result.values(), [Fr(4), Fr(8), Fr(12)])
+
+    def test_domains(self):
+        a = Polynomial([Fr(1), Fr(2)], [Fr(5), Fr(6)])
+        b = Polynomial([Fr(3), Fr(4)], [Fr(5), Fr(6)])
+        self.assertEqual((a + b).values(), [Fr(4), Fr(6)])
+
+        # Domains which are not continuous are compared by their values
+        c = Polynomial([Fr(1), Fr(2)], [Fr(5), Fr(2)])
+        d = Polynomial([Fr(1), Fr(2)], [Fr(5), Fr(2)])
+        self.assertEqual(c, d)
+        self.assertNotEqual(a, c)
+        with self.assertRaises(Exception):
+            a + c
+
     def test_interpolation(self):
         domain = [Fr(0), Fr(1), Fr(2), Fr(3), Fr(4), Fr(5)]
 
@@ -1,19 +1,17 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from .monomial_basis import MonomialBasis
 from .lagrange_basis import LagrangeBasis
-from typing import List
+from typing import Dict, List, Tuple
 from ecc import Fr
+from ecc.field import FieldVector
+
+# Weights for each domain, shared by the whole process. See `PrecomputedWeights.cached`
+_cache: Dict[Tuple[int, int], PrecomputedWeights] = {}
 
 
 @dataclass
 class PrecomputedWeights:
-    # TODO: We don't _need_ to store the vanishing polynomial
-    # TODO: we only need to store its derivative and whenever we need to evaluate
-    # TODO: the vanishing polynomial, it can be done via the domain
-    # Vanishing polynomial
-    A: MonomialBasis
-    # Derivative of the vanishing polynomial
-    Aprime: MonomialBasis
     # Aprime evaluated on the domain
     Aprime_DOMAIN: LagrangeBasis
     # Aprime evaluated on the domain and then inverted
@@ -29,53 +27,140 @@ class PrecomputedWeights:
 
         self.domain = domain
         domain_size = len(domain)
+        modulus = Fr.MODULUS
 
-        self.A = MonomialBasis.vanishing_poly(domain)
+        # The vanishing polynomial and its derivative are only needed by callers
+        # which use them directly, so they are computed on first use
+        self._A = None
+        self._Aprime = None
 
-        Aprime = MonomialBasis._empty()
-        Aprime.formal_derivative(self.A)
-        self.Aprime = Aprime
+        # Since the domain is continuous, A'(DOMAIN[i]) = prod_{j != i} (i - j)
+        # = i! * (-1)^(n - 1 - i) * (n - 1 - i)!
+        factorials = [1]
+        for i in range(1, domain_size):
+            factorials.append(factorials[-1] * i % modulus)
 
         self.Aprime_DOMAIN = []
-        self.Aprime_DOMAIN_inv = []
-
-        for x in range(len(domain)):
-            Aprime_x = self.Aprime.evaluate(Fr(x))
-
-            APrime_x_inv = Fr.zero()
-            APrime_x_inv.inv(Aprime_x)
-
-            self.Aprime_DOMAIN.append(Aprime_x)
-            self.Aprime_DOMAIN_inv.append(APrime_x_inv)
+        for i in range(domain_size):
+            Aprime_x = factorials[i] * factorials[domain_size - 1 - i]
+            if (domain_size - 1 - i) % 2 == 1:
+                Aprime_x = -Aprime_x
+            self.Aprime_DOMAIN.append(Fr(Aprime_x))
 
         # This is not fully correct as the first element will be the inverse of 0
         # We keep it this way for now because it is what the research code did
         # TODO: refactor this to make it more readable
         # If domain size is 4 for example, the output would be:
         # [1/0, 1/1, 1/2, 1/3, -1/3, -1/2,-1/1]
-        inverses = []
-        for d in list(range(domain_size)) + list(range(-domain_size + 1, 0)):
-            d_inv = Fr.zero()
-            d_inv.inv(Fr(d))
-            inverses.append(d_inv)
+        # The inverse of 0 is returned as 0 by `multi_inv`
+        #
+        # All of the inversions are done together
+        inverses = Fr.multi_inv(
+            self.Aprime_DOMAIN + [Fr(d) for d in range(domain_size)])
+        self.Aprime_DOMAIN_inv = inverses[:domain_size]
+        positive_inverses = inverses[domain_size:]
+
+        self.domain_inverses = positive_inverses + \
+            [-d_inv for d_inv in reversed(positive_inverses[1:])]
+
+        # Built on first use, see `quotient_weights`
+        self._quotient_weights = {}
+
+    # Returns the weights for `domain`, which are only computed the first time that the domain is used.
+    # The weights are shared, so they must not be modified
+    #
+    # A continuous domain is determined by its first element and its size, which are used as the key
+    def cached(domain: List[Fr]) -> PrecomputedWeights:
+        if not check_domain_is_continuous_and_increasing(domain):
+            raise Exception("domain must be continuous and increasing")
+        key = (domain[0].value, len(domain))
+        weights = _cache.get(key)
+        if weights is None:
+            weights = PrecomputedWeights(domain)
+            _cache[key] = weights
+        return weights
+
+    # Makes `cached` return `weights` for their domain, for example weights loaded with `load_weights`
+    def set_cached(weights: PrecomputedWeights):
+        if not check_domain_is_continuous_and_increasing(weights.domain):
+            raise Exception("domain must be continuous and increasing")
+        _cache[(weights.domain[0].value, len(weights.domain))] = weights
+
+    # Returns the weights used to divide a polynomial by (X - DOMAIN[index]), see multiproof/quotient.py:
+    #
+    #   w[i] = 1 / (DOMAIN[i] - DOMAIN[index]), and zero for i = index
+    #   u[i] = A'(DOMAIN[index]) / (A'(DOMAIN[i]) * (DOMAIN[index] - DOMAIN[i])), and zero for i = index
+    #
+    # and the sum of u. The weights for each index are computed once
+    def quotient_weights(self, index: int) -> Tuple[FieldVector, FieldVector, Fr]:
+        weights = self._quotient_weights.get(index)
+        if weights is not None:
+            return weights
+
+        modulus = Fr.MODULUS
+        domain_size = len(self.domain)
+        inverses = self.domain_inverses
+        Aprime_index = self.Aprime_DOMAIN[index].value
+
+        w = [inverses[i - index].value for i in range(domain_size)]
+        u = [inverses[index - i].value * Aprime_index % modulus * self.Aprime_DOMAIN_inv[i].value % modulus
+             for i in range(domain_size)]
+        u_sum = Fr(sum(u))
+
+        weights = (FieldVector.from_ints(Fr, w),
+                   FieldVector.from_ints(Fr, u), u_sum)
+        self._quotient_weights[index] = weights
+        return weights
 
-        self.domain_inverses = inverses
+    # Vanishing polynomial
+    @property
+    def A(self) -> MonomialBasis:
+        if self._A is None:
+            self._A = MonomialBasis.vanishing_poly(self.domain)
+        return self._A
 
-    def barycentric_formula_constants(self, z):
+    # Derivative of the vanishing polynomial
+    @property
+    def Aprime(self) -> MonomialBasis:
+        if self._Aprime is None:
+            Aprime = MonomialBasis._empty()
+            Aprime.formal_derivative(self.A)
+            self._Aprime = Aprime
+        return self._Aprime
+
+    def barycentric_formula_constants(self, z) -> FieldVector:
         """
         Gives the constant used in the barycentric formula when evaluating a polynomial at z
         b_i = A(z) / A'(DOMAIN[i]) * 1 / (z - DOMAIN[i])
         """
+        return self.batch_barycentric_formula_constants([z])[0]
+
+    def batch_barycentric_formula_constants(self, zs: List[Fr]) -> List[FieldVector]:
+        """
+        Same as `barycentric_formula_constants` for each z in `zs`, using a single field inversion.
+
+        A(z) is the product of the differences z - DOMAIN[i], which are inverted anyway,
+        so the vanishing polynomial is never evaluated
+        """
+        modulus = Fr.MODULUS
+        domain_size = len(self.domain)
+        Aprime_DOMAIN_inv = [x.value for x in self.Aprime_DOMAIN_inv]
 
-        r: List[Fr] = []
-        Az = self.A.evaluate(z)
+        differences = [z - x for z in zs for x in self.domain]
+        inverses = Fr.multi_inv(differences)
 
-        inverses = Fr.multi_inv([z - x for x in self.domain])
+        result = []
+        for start in range(0, len(differences), domain_size):
+            Az = 1
+            for difference in differences[start:start + domain_size]:
+                Az = Az * difference.value % modulus
 
-        for i, x in enumerate(inverses):
-            r.append(Az * self.Aprime_DOMAIN_inv[i] * x)
+            # If z is in the domain, A(z) is zero and so are the constants
+            constants = [Az * Aprime_x_inv % modulus * x_inv.value % modulus
+                         for Aprime_x_inv, x_inv in zip(Aprime_DOMAIN_inv, inverses[start:start + domain_size])]
+            result.append(FieldVector.from_ints(Fr, constants))
 
-        return r
+        return result
 
 
 def check_domain_is_continuous_and_increasing(domain: List[Fr]):
@@ -1,29 +1,87 @@
-# import unittest
-# from ecc import Fr
-# from .precomputed_weights import check_domain_is_continuous_and_increasing
+import unittest
+from ecc import Fr
+from .precomputed_weights import PrecomputedWeights, check_domain_is_continuous_and_increasing
 
 
-# class TestPrecomputedWeights(unittest.TestCase):
+class TestPrecomputedWeights(unittest.TestCase):
 
-#     def test_domain_correctness(self):
-#         """
-#             Test that the domain is continuos and increasing. If this is not the case
-#             then the setup for precomputed weights, will need to be changed
-#         """
-#         domain = [Fr(0), Fr(1), Fr(2), Fr(3), Fr(4), Fr(5)]
-#         domain_is_correct = check_domain_is_continuous_and_increasing(domain)
-#         self.assertTrue(domain_is_correct)
+    def test_domain_correctness(self):
+        """
+            Test that the domain is continuos and increasing. If this is not the case
+            then the setup for precomputed weights, will need to be changed
+        """
+        domain = [Fr(0), Fr(1), Fr(2), Fr(3), Fr(4), Fr(5)]
+        domain_is_correct = check_domain_is_continuous_and_increasing(domain)
+        self.assertTrue(domain_is_correct)
 
-#         # This domain has a gap between 0 and 2
-#         domain = [Fr(0), Fr(2), Fr(3), Fr(4), Fr(5)]
-#         domain_is_correct = check_domain_is_continuous_and_increasing(domain)
-#         self.assertFalse(domain_is_correct)
+        # This domain has a gap between 0 and 2
+        domain = [Fr(0), Fr(2), Fr(3), Fr(4), Fr(5)]
+        domain_is_correct = check_domain_is_continuous_and_increasing(domain)
+        self.assertFalse(domain_is_correct)
 
-#         # This domain is not increasing
-#         domain = [Fr(5), Fr(4), Fr(3), Fr(2), Fr(1)]
-#         domain_is_correct = check_domain_is_continuous_and_increasing(domain)
-#         self.assertFalse(domain_is_correct)
+        # This domain is not increasing
+        domain = [Fr(5), Fr(4), Fr(3), Fr(2), Fr(1)]
+        domain_is_correct = check_domain_is_continuous_and_increasing(domain)
+        self.assertFalse(domain_is_correct)
 
+    def test_weights(self):
+        """
+            Test the closed form weights against evaluating the derivative of the vanishing polynomial
+        """
+        domain = [Fr(i) for i in range(8)]
+        weights = PrecomputedWeights(domain)
 
-# if __name__ == '__main__':
-#     unittest.main()
+        for i, x in enumerate(domain):
+            expected = weights.Aprime.evaluate(x)
+            self.assertEqual(weights.Aprime_DOMAIN[i], expected)
+            self.assertEqual(weights.Aprime_DOMAIN_inv[i] * expected, Fr.one())
+
+        expected_inverses = [Fr.zero()] + [Fr.one() / Fr(d) for d in range(1, 8)] + \
+            [Fr.one() / Fr(d) for d in range(-7, 0)]
+        self.assertEqual(weights.domain_inverses, expected_inverses)
+
+    def test_barycentric_formula_constants(self):
+        """
+            Test the constants against evaluating the vanishing polynomial
+        """
+        domain = [Fr(i) for i in range(8)]
+        weights = PrecomputedWeights(domain)
+        z = Fr(1234)
+
+        Az = weights.A.evaluate(z)
+        expected = [Az * weights.Aprime_DOMAIN_inv[i] / (z - x)
+                    for i, x in enumerate(domain)]
+
+        self.assertEqual(
+            weights.barycentric_formula_constants(z).to_list(), expected)
+
+        zs = [z, Fr(3), Fr(-5)]
+        batch = weights.batch_barycentric_formula_constants(zs)
+        self.assertEqual(len(batch), 3)
+        for got, z in zip(batch, zs):
+            self.assertEqual(got, weights.barycentric_formula_constants(z))
+
+        # A(z) is zero inside the domain
+        self.assertEqual(batch[1].to_list(), [Fr.zero()] * 8)
+
+    def test_cached(self):
+        domain = [Fr(i) for i in range(16)]
+
+        weights = PrecomputedWeights.cached(domain)
+
+        self.assertIs(PrecomputedWeights.cached(
+            [Fr(i) for i in range(16)]), weights)
+        self.assertIsNot(PrecomputedWeights.cached(domain[:8]), weights)
+
+        # The key only identifies continuous domains, so other domains are rejected
+        with self.assertRaises(Exception):
+            PrecomputedWeights.cached([Fr(0)] + [Fr(i) for i in range(2, 17)])
+
+        weights = PrecomputedWeights([Fr(i) for i in range(4)])
+        weights.domain = [Fr(0), Fr(1), Fr(3), Fr(4)]
+        with self.assertRaises(Exception):
+            PrecomputedWeights.set_cached(weights)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import hashlib
+import mmap
+import os
+import struct
+from typing import List
+from ecc import Fr
+from .precomputed_weights import PrecomputedWeights
+
+# On-disk snapshot of `PrecomputedWeights`, which is memory mapped when it is loaded,
+# so that processes using the same file share one read-only copy of the weights.
+#
+# Layout (integers are little endian):
+#
+#   magic               8 bytes
+#   scalars hash        32 bytes, sha256 of the scalars section
+#   domain size         4 bytes, n
+#   scalars             (4n) * 32 bytes, each scalar is 32 bytes little endian:
+#                           the first element of the domain
+#                           Aprime_DOMAIN, n scalars
+#                           Aprime_DOMAIN_inv, n scalars
+#                           domain_inverses, 2n - 1 scalars
+MAGIC = b"VKLPW001"
+HEADER_FORMAT = "<8s32sI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SCALAR_SIZE = 32
+
+
+# A read-only list of scalars, which are decoded from the buffer when they are accessed
+class ScalarView():
+    __slots__ = ("buffer", "offset", "length")
+
+    def __init__(self, buffer, offset: int, length: int):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if index < 0 or index >= self.length:
+            raise IndexError("scalar index out of range")
+        start = self.offset + index * SCALAR_SIZE
+        return Fr(int.from_bytes(self.buffer[start:start + SCALAR_SIZE], byteorder='little'))
+
+    def __iter__(self):
+        for index in range(self.length):
+            yield self[index]
+
+
+def _scalars_to_bytes(scalars: List[Fr]) -> bytes:
+    result = bytearray()
+    for scalar in scalars:
+        result += scalar.to_bytes()
+    return bytes(result)
+
+
+def weights_to_bytes(weights: PrecomputedWeights) -> bytes:
+    scalars = _scalars_to_bytes([weights.domain[0]] + list(weights.Aprime_DOMAIN) +
+                                list(weights.Aprime_DOMAIN_inv) + list(weights.domain_inverses))
+    header = struct.pack(HEADER_FORMAT, MAGIC, hashlib.sha256(scalars).digest(),
+                         len(weights.domain))
+    return header + scalars
+
+
+# The file is written to a temporary path first, so concurrent readers never see a partial file.
+def save_weights(weights: PrecomputedWeights, path):
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(weights_to_bytes(weights))
+    os.replace(tmp_path, path)
+
+
+# Returns None if the file does not exist or is malformed.
+# The weights are decoded from the mapped file when they are accessed.
+#
+# If `cache` is True, the loaded weights are also used by `PrecomputedWeights.cached`
+def load_weights(path, cache=False) -> PrecomputedWeights:
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < HEADER_SIZE:
+        return None
+
+    magic, scalars_hash, domain_size = struct.unpack_from(
+        HEADER_FORMAT, buffer, 0)
+    if magic != MAGIC or domain_size == 0:
+        return None
+    if len(buffer) != HEADER_SIZE + 4 * domain_size * SCALAR_SIZE:
+        return None
+    if hashlib.sha256(buffer[HEADER_SIZE:]).digest() != scalars_hash:
+        return None
+
+    offset = HEADER_SIZE
+    domain_start = ScalarView(buffer, offset, 1)[0]
+    offset += SCALAR_SIZE
+
+    weights = PrecomputedWeights.__new__(PrecomputedWeights)
+    weights.domain = [domain_start + Fr(i) for i in range(domain_size)]
+    weights._A = None
+    weights._Aprime = None
+    weights._quotient_weights = {}
+
+    weights.Aprime_DOMAIN = ScalarView(buffer, offset, domain_size)
+    offset += domain_size * SCALAR_SIZE
+    weights.Aprime_DOMAIN_inv = ScalarView(buffer, offset, domain_size)
+    offset += domain_size * SCALAR_SIZE
+    weights.domain_inverses = ScalarView(buffer, offset, 2 * domain_size - 1)
+
+    if cache:
+        PrecomputedWeights.set_cached(weights)
+    return weights
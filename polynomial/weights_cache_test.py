@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from ecc import Fr
+from .precomputed_weights import PrecomputedWeights
+from .weights_cache import load_weights, save_weights, weights_to_bytes, HEADER_SIZE, SCALAR_SIZE
+
+
+class TestWeightsCache(unittest.TestCase):
+
+    def test_round_trip(self):
+        domain = [Fr(i) for i in range(16)]
+        weights = PrecomputedWeights(domain)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.bin")
+            self.assertIsNone(load_weights(path))
+
+            save_weights(weights, path)
+            self.assertEqual(os.path.getsize(path),
+                             HEADER_SIZE + 4 * 16 * SCALAR_SIZE)
+
+            loaded = load_weights(path)
+            self.assertEqual(loaded.domain, weights.domain)
+            self.assertEqual(list(loaded.Aprime_DOMAIN), weights.Aprime_DOMAIN)
+            self.assertEqual(list(loaded.Aprime_DOMAIN_inv),
+                             weights.Aprime_DOMAIN_inv)
+            self.assertEqual(list(loaded.domain_inverses),
+                             weights.domain_inverses)
+            self.assertEqual(loaded.domain_inverses[-1], Fr.one() / Fr(-1))
+
+            z = Fr(1000)
+            self.assertEqual(loaded.barycentric_formula_constants(z),
+                             weights.barycentric_formula_constants(z))
+
+    def test_rejects_corrupted_file(self):
+        weights = PrecomputedWeights([Fr(i) for i in range(4)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "weights.bin")
+            buffer = bytearray(weights_to_bytes(weights))
+            buffer[HEADER_SIZE + 5] ^= 1
+            with open(path, "wb") as f:
+                f.write(buffer)
+
+            self.assertIsNone(load_weights(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,10 @@
 
 # Alias for different byte sizes that we use
+from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 from ecc import Fr, Banderwagon
 # from ssz import Byte
-import copy
 
 bytes31 = bytes
 bytes32 = bytes
@@ -15,11 +15,26 @@ byte = int
 
 @dataclass
 class VerkleCommitment:
+    __slots__ = ("_point", "_point_as_field")
     _point: Banderwagon
-    _point_as_field: Optional[Fr] = None
+    _point_as_field: Optional[Fr]
+
+    def __init__(self, point: Banderwagon, point_as_field: Optional[Fr] = None):
+        self._point = point
+        self._point_as_field = point_as_field
 
     def empty():
-        return copy.deepcopy(VerkleCommitment(Banderwagon.identity()))
+        return VerkleCommitment(Banderwagon.identity())
+
+    # Commitments are compared as points, the cached hash may not have been computed for both of them
+    def __eq__(self, other):
+        if isinstance(other, VerkleCommitment):
+            return Banderwagon.equal(self._point, other._point)
+        return NotImplemented
+
+    # The cached hash is replaced rather than modified, so the copy can share it
+    def dup(self):
+        return VerkleCommitment(self._point.dup(), self._point_as_field)
 
     # TODO: should we call this compute_hash?
     def commitment_to_field(self) -> Fr:
@@ -29,7 +44,20 @@ class VerkleCommitment:
             self._point_as_field = Fr.from_bytes_reduce(map_to_bytes)
         return self._point_as_field
 
+    # Computes `commitment_to_field` for every commitment which does not have it cached yet,
+    # using a single field inversion for all of them
+    def batch_commitment_to_field(commitments: List[VerkleCommitment]):
+        pending = [
+            commitment for commitment in commitments if commitment._point_as_field is None]
+        fields = Banderwagon.batch_map_to_field(
+            [commitment._point for commitment in pending])
+        for commitment, field in zip(pending, fields):
+            commitment._point_as_field = Fr.from_bytes_reduce(field.to_bytes())
+
+    # The hash is recomputed lazily, so that the commitments which changed
+    # can be hashed together with `batch_commitment_to_field`
     def add_point(self, point:  Banderwagon):
+        if point.is_identity():
+            return
         self._point.add(self._point, point)
         self._point_as_field = None
-        self.commitment_to_field()
@@ -5,30 +5,66 @@ from typing import Callable, Dict, Union
 from ecc import Fr
 from verkle.common_types import VerkleCommitment
 from verkle.nodes.suffix_tree import SuffixTree
-import copy
 
 
 @dataclass
 class InnerNode:
+    __slots__ = ("children", "node_commitment")
     children: Dict[Bytes, Node]
-    node_commitment: VerkleCommitment = VerkleCommitment.empty()
+    node_commitment: VerkleCommitment
+
+    # Each inner node gets its own empty commitment, since it is updated in place
+    def __init__(self, children: Dict[Bytes, Node], node_commitment=None):
+        self.children = children
+        self.node_commitment = VerkleCommitment.empty(
+        ) if node_commitment is None else node_commitment
 
     def empty():
-        # Without this deepcopy, python will assign all inner nodes whom
-        # are instantiated with this empty function, the same address.
-        # This is extremely unintuitive behavior and broke tests.
-        return copy.deepcopy(InnerNode({}))
+        return InnerNode({})
 
+    # Computes the commitment of every node in this subtree.
+    # The nodes are processed one depth level at a time, starting from the deepest level,
+    # so that all of the commitments on a level can be hashed with a single field inversion
     def compute_commitment(self, committer: Callable[[Dict[Bytes, Fr]], VerkleCommitment]):
-        child_values = {}
+        levels = [[self]]
+        while True:
+            next_level = [child for node in levels[-1] if isinstance(node, InnerNode)
+                          for child in node.children.values()]
+            if len(next_level) == 0:
+                break
+            levels.append(next_level)
+
+        for level in reversed(levels):
+            suffix_trees = [node for node in level if isinstance(node, SuffixTree)]
+            inner_nodes = [node for node in level if isinstance(node, InnerNode)]
+
+            SuffixTree.batch_compute_commitment(suffix_trees, committer)
 
+            # The children are one level deeper, so their commitments are already computed
+            VerkleCommitment.batch_commitment_to_field(
+                [child.node_commitment for node in inner_nodes for child in node.children.values()])
+            for node in inner_nodes:
+                node.commit_to_children(committer)
+
+    # Computes the commitment from the hashes of the children, the children must have
+    # their commitments computed already
+    def commit_to_children(self, committer: Callable[[Dict[Bytes, Fr]], VerkleCommitment]):
+        child_values = {}
         for child_idx, node in self.children.items():
-            node.compute_commitment(committer)
-            child_val = node.commitment_to_field()
-            child_values[child_idx] = child_val
+            child_values[child_idx] = node.commitment_to_field()
 
         self.node_commitment = committer(child_values)
-        self.node_commitment.commitment_to_field()
+
+    # Updates the commitment after the children at the indices in `old_child_hashes` have changed.
+    # `old_child_hashes` maps each of these indices to the hash of the child before the change,
+    # an empty child has a hash of zero
+    def update_children(self, old_child_hashes: Dict[Bytes, Fr], crs):
+        changes = {}
+        for child_idx, old_hash in old_child_hashes.items():
+            changes[child_idx] = (
+                old_hash, self.children[child_idx].commitment_to_field())
+
+        self.node_commitment.add_point(crs.commit_delta(changes))
 
     def __getitem__(self, index):
         return self.children[index]
@@ -1,10 +1,9 @@
+from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Tuple
 from crs.crs import CRS
-from ecc import Fr, Banderwagon
+from ecc import Fr
 from verkle.common_types import VerkleCommitment, bytes32, bytes16, bytes31, byte
-from crs import commit
-import copy
 
 
 @dataclass
@@ -52,6 +51,14 @@ class VerkleValue:
             return (low_fr, high_fr)
 
 
+# `low_high` returns integers for a value which does not exist,
+# the deltas in the commitment updates need field elements
+def _low_high_fr(value: VerkleValue) -> Tuple[Fr, Fr]:
+    if value.value is None:
+        return (Fr.zero(), Fr.zero())
+    return value.low_high()
+
+
 # TODO: We could create a bytes32 class which solely holds a 32 byte array and
 # then add methods on top of it
 def split_bytes32(byts: bytes32) -> Tuple[bytes16, bytes16]:
@@ -90,14 +97,24 @@ VALUE_EXISTS_MARKER = Fr(2**128)
 
 @dataclass
 class SuffixTree:
+    __slots__ = ("stem", "values", "C1", "C2", "extension_commitment")
     # Stem. This is 31 bytes
     stem: bytes31
     # If we change this to Dict[byte, Value], we need to change this line:VerkleValue(self.values[child_idx])
     values: Dict[byte, VerkleValue]
-    C1: VerkleCommitment = VerkleCommitment.empty()
-    C2: VerkleCommitment = VerkleCommitment.empty()
+    C1: VerkleCommitment
+    C2: VerkleCommitment
     # Commitment to the extension
-    extension_commitment: VerkleCommitment = VerkleCommitment.empty()
+    extension_commitment: VerkleCommitment
+
+    # Each suffix tree gets its own empty commitments, since they are updated in place
+    def __init__(self, stem: bytes31, values: Dict[byte, VerkleValue], C1=None, C2=None, extension_commitment=None):
+        self.stem = stem
+        self.values = values
+        self.C1 = VerkleCommitment.empty() if C1 is None else C1
+        self.C2 = VerkleCommitment.empty() if C2 is None else C2
+        self.extension_commitment = VerkleCommitment.empty(
+        ) if extension_commitment is None else extension_commitment
 
     # Computing suffix commitment consists of committing to
     # 256 values. Each of these values are 256 bytes.
@@ -126,6 +143,21 @@ class SuffixTree:
     # the prime, since the prime is ~255 bits.
     # TODO: rename to compute_metadata?
     def compute_commitment(self, committer: Callable[[Dict[byte, Fr]], VerkleCommitment]):
+        SuffixTree.batch_compute_commitment([self], committer)
+
+    # Computes the commitments of many suffix trees.
+    # C1 and C2 of all of the suffix trees are hashed with a single field inversion
+    def batch_compute_commitment(suffix_trees: List[SuffixTree], committer: Callable[[Dict[byte, Fr]], VerkleCommitment]):
+        for suffix_tree in suffix_trees:
+            suffix_tree.compute_c1_c2(committer)
+
+        VerkleCommitment.batch_commitment_to_field(
+            [C for suffix_tree in suffix_trees for C in [suffix_tree.C1, suffix_tree.C2]])
+
+        for suffix_tree in suffix_trees:
+            suffix_tree.compute_extension_commitment(committer)
+
+    def compute_c1_c2(self, committer: Callable[[Dict[byte, Fr]], VerkleCommitment]):
         values_c1 = {}
         values_c2 = {}
 
@@ -145,16 +177,12 @@ class SuffixTree:
         self.C1 = committer(values_c1)
         self.C2 = committer(values_c2)
 
-        c1_field = self.C1.commitment_to_field()
-        c2_field = self.C2.commitment_to_field()
-
+    def compute_extension_commitment(self, committer: Callable[[Dict[byte, Fr]], VerkleCommitment]):
         self.extension_commitment = committer({
             0: Fr.one(),
             1: Fr.from_bytes(self.stem),
-            2: c1_field,
-            3: c2_field})
-
-        self.extension_commitment.commitment_to_field()
+            2: self.C1.commitment_to_field(),
+            3: self.C2.commitment_to_field()})
 
     # This means that we need to update one of the child nodes
     def replace_child_element(self, child_idx: byte, _new_value: bytes32, crs: CRS):
@@ -168,47 +196,51 @@ class SuffixTree:
         if child_idx in self.values:
             old_value = self.values[child_idx]
 
-        old_val_lower, old_val_higher = old_value.low_high()
-        new_value = VerkleValue(_new_value)
-        new_val_lower, new_val_higher = new_value.low_high()
-
-        # TODO: Use node width instead of hardcoded 256
-        comm_index_lower = (2 * child_idx) % 256
-        comm_index_higher = (2 * child_idx + 1) % 256
+        self.values[child_idx] = VerkleValue(_new_value)
 
-        comm_lower = crs[comm_index_lower]
-        comm_higher = crs[comm_index_higher]
+        old_c1_field, old_c2_field = self.update_c1_c2({child_idx: old_value}, crs)
+        VerkleCommitment.batch_commitment_to_field([self.C1, self.C2])
+        self.update_extension_commitment(old_c1_field, old_c2_field, crs)
 
-        delta_lower_change = new_val_lower - old_val_lower
-        delta_higher_change = new_val_higher - old_val_higher
-
-        commitment_change = commit([comm_lower, comm_higher], [
-                                   delta_lower_change, delta_higher_change])
-
-        # Now need to update C1 or C2
-        # TODO: Use node width / 2 instead of hardcoded 128
-        # This value is determined by halving the number of possible values for a stem
-        if child_idx < 128:
-            self._update_c1(commitment_change, crs)
-        else:
-            self._update_c2(commitment_change, crs)
-
-    def _update_c1(self, commitment_change: Banderwagon, crs: CRS):
+    # Updates C1 and C2 after the values at the indices in `old_values` have changed.
+    # `old_values` maps each of these indices to the value before the change.
+    #
+    # Returns the hashes of C1 and C2 before the change, which `update_extension_commitment` needs
+    # once the new hashes have been computed
+    def update_c1_c2(self, old_values: Dict[byte, VerkleValue], crs: CRS) -> Tuple[Fr, Fr]:
+        old_c1_field = self.C1.commitment_to_field()
+        old_c2_field = self.C2.commitment_to_field()
+
+        changes_c1 = {}
+        changes_c2 = {}
+        for child_idx, old_value in old_values.items():
+            old_val_lower, old_val_higher = _low_high_fr(old_value)
+            new_val_lower, new_val_higher = _low_high_fr(self.values[child_idx])
+
+            # TODO: Use node width instead of hardcoded 256
+            comm_index_lower = (2 * child_idx) % 256
+            comm_index_higher = (2 * child_idx + 1) % 256
+
+            # TODO: Use node width / 2 instead of hardcoded 128
+            # This value is determined by halving the number of possible values for a stem
+            changes = changes_c1 if child_idx < 128 else changes_c2
+            changes[comm_index_lower] = (old_val_lower, new_val_lower)
+            changes[comm_index_higher] = (old_val_higher, new_val_higher)
+
+        if len(changes_c1) > 0:
+            self.C1.add_point(crs.commit_delta(changes_c1))
+        if len(changes_c2) > 0:
+            self.C2.add_point(crs.commit_delta(changes_c2))
+
+        return old_c1_field, old_c2_field
+
+    def update_extension_commitment(self, old_c1_field: Fr, old_c2_field: Fr, crs: CRS):
         C1_INDEX = 2
-        self._update_c1_or_c2(commitment_change, self.C1, crs[C1_INDEX])
-
-    def _update_c2(self, commitment_change: Banderwagon, crs: CRS):
         C2_INDEX = 3
-        self._update_c1_or_c2(commitment_change, self.C2, crs[C2_INDEX])
-
-    def _update_c1_or_c2(self, commitment_change: Banderwagon, C_commitment: VerkleCommitment, C_group_element: Banderwagon):
 
-        old_c_field = C_commitment.commitment_to_field()
-        C_commitment.add_point(commitment_change)
-        new_c_field = C_commitment.commitment_to_field()
-
-        delta_c_change = new_c_field - old_c_field
-        commitment_change = C_group_element * delta_c_change
+        commitment_change = crs.commit_delta({
+            C1_INDEX: (old_c1_field, self.C1.commitment_to_field()),
+            C2_INDEX: (old_c2_field, self.C2.commitment_to_field())})
 
         self.extension_commitment.add_point(commitment_change)
 
@@ -220,11 +252,17 @@ class SuffixTree:
 
     # TODO: rename to node_hash
     def commitment_to_field(self):
-        return copy.deepcopy(self.extension_commitment.commitment_to_field())
+        return self.extension_commitment.commitment_to_field().dup()
 
     # TODO: rename to node_commitment
     def commitment(self):
-        return copy.deepcopy(self.extension_commitment)
+        return self.extension_commitment.dup()
+
+    # The commitment which is hashed by the parent, this is not a copy.
+    # It has the same name as the attribute on InnerNode, so both can be hashed together
+    @property
+    def node_commitment(self):
+        return self.extension_commitment
 
     def __getitem__(self, index):
         return self.values[index]
@@ -1,7 +1,9 @@
 from crs.crs import CRS
 from ecc import Banderwagon, Fr
-from typing import Dict, List
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
 from verkle.nodes import InnerNode, SuffixTree, VerkleValue
+from verkle.nodes.inner_node import Node
 from .common_types import VerkleCommitment, bytes32
 
 # Verkle trie parameters
@@ -39,146 +41,178 @@ def path_diff(stem_a, stem_b):
     return (same_path, None)
 
 
+# The changes made to a node by `insert_batch`, which have not been applied to its commitment yet
+@dataclass
+class NodeUpdate:
+    node: Node
+    depth: int
+    # New nodes have their commitment computed from scratch
+    is_new: bool
+    # For inner nodes, this maps each changed index to the hash of the child before the batch.
+    # For suffix trees, this maps each changed suffix to the value before the batch
+    old: Dict[int, Union[Fr, VerkleValue]] = field(default_factory=dict)
+
+
 class VerkleTrie():
-    def __init__(self,  crs: CRS):
+    # If `crs` is None, the CRS shared by the process is used, see `CRS.default`
+    def __init__(self,  crs: Optional[CRS] = None):
+        if crs is None:
+            crs = CRS.default()
         self.crs = crs
         self.root_node = InnerNode.empty()
 
     def insert(self, key: bytes32, value: bytes32):
-        current_node = self.root_node
-        index = None
-        path = []
+        self.insert_batch([key], [value])
+
+    # The values are first inserted without updating any commitments, while we record
+    # which nodes have changed. The commitments are then updated one depth level at a time,
+    # starting from the deepest level, so that:
+    # - A node which is changed by many keys only has its commitment updated once
+    # - All of the commitments which changed on a level are hashed with a single field inversion
+    def insert_batch(self, keys: List[bytes32], values: List[bytes32]):
+        updates = {}
+        for key, value in zip(keys, values):
+            self._insert_value(key, value, updates)
+        self._update_commitments(updates)
+
+    # Inserts the value into the trie without updating any commitments.
+    # The changes are recorded in `updates`, see `_update_commitments`
+    def _insert_value(self, key: bytes32, value: bytes32, updates: Dict[int, NodeUpdate]):
         stem = get_stem(key)
         suffix = get_suffix(key)
 
-        #  Iterate down the path given by the stem, stopping if the current_node/parent is a suffix tree or
+        #  Iterate down the path given by the stem, stopping if the child is a suffix tree or
         #  if the inner node does not have an element at the child which you will go to next
+        node = self.root_node
+        depth = 0
         while True:
-            index = stem[len(path)]
-            old_node_hash = current_node.commitment_to_field()
-            path.append((index, old_node_hash, current_node))
+            index = stem[depth]
+            self._record_child_change(updates, node, depth, index)
 
-            if current_node.contains_index(index) and isinstance(current_node, InnerNode):
+            if node.contains_index(index) and isinstance(node[index], InnerNode):
                 #  Keep traversing inner nodes
-                current_node = current_node[index]
+                node = node[index]
+                depth += 1
             else:
                 break
 
-        # The while loop can only be broken on two conditions
-        # 1) We encountered a Suffix Tree
-        # 2) The current index is not in the node. ie the child at that index is empty
-        #
-        # Case 1)
-        # We have two sub-cases to consider:
-        # 1a) The stem matches the suffix tree that we have come across
-        # 1b) The stem does not match the suffix tree and we need to extend the path with inner nodes
-        #
-        # Case 2)
-        # If the inner node was empty, then we can add a suffix tree at that index
-
-        last_child_node_value_change = None
-        # So this means that we have entered case 1
-        # The suffix node at the end of the path, is the current node
-        if isinstance(current_node, SuffixTree):
-            # Case 1a, there are no other nodes to add to the path
-            if current_node.stem == stem:
-                index, old_node_hash, suffix_node = path.pop()
-                old_node_hash = suffix_node.commitment_to_field()
-                suffix_node.replace_child_element(
-                    suffix, value, self.crs)
-                new_node_hash = suffix_node.commitment_to_field()
-
-                last_child_node_value_change = new_node_hash - old_node_hash
-
-            # We need to create intermediate inner nodes to add to the path
-            # For the indices that the new stem and the old stem match on
-            else:
-                # We want to remove the old suffix tree from the path
-                _, old_node_hash, old_suffix_tree = path.pop()
-                child_index, _, parent_node = path[-1]
-
-                # This is the inner node that replaces the old suffix tree
-                # Note: Its `old node hash` will be the node hash for the old suffix tree
-                suffix_replacement_node = InnerNode.empty()
-                parent_node[child_index] = suffix_replacement_node
-                parent_node = suffix_replacement_node
-
-                # Stems are offsetted to the point that we are in the path
-                old_stem_offset = old_suffix_tree.stem[len(path):]
-                new_stem_offset = stem[len(path):]
-
-                # Returns the indices that they both share and the first differing index
-                # Since the stems are not the same (Case 1a), we are sure that there will be a differing index
-                # We are also sure that there will be at least one index in the common_path, or else we would have triggered
-                # a different case
-                common_path, diff_index = path_diff(
-                    old_stem_offset, new_stem_offset)
-
-                # Create the intermediate inner nodes, for each matching stem index
-                # Note: Apart from the suffix_replacement_node, all other nodes
-                # will have an old root value of 0
-                for same_index in common_path:
-                    assert(isinstance(parent_node, InnerNode))
-
-                    intermediate_node = InnerNode.empty()
-                    parent_node[same_index] = intermediate_node
-                    path.append(
-                        (same_index, old_node_hash, parent_node))
-
-                    parent_node = intermediate_node
-                    old_node_hash = Fr(0)
-
-                old_index, new_index = diff_index
-
-                values = {suffix: VerkleValue(value)}
-                parent_node[new_index] = SuffixTree(
-                    stem, values)
-                parent_node[old_index] = old_suffix_tree
-
-                # We pop off the last inner node, so that we can compute its change in value
-                # We know that this inner node, is an intermediate node
-                # whose previous value was zero because the above for loop must have
-                # looped at least once
-                index, old_node_hash, last_node = path.pop()
-                last_node.compute_commitment(self._commit_sparse)
-                last_child_node_value_change = last_node.commitment_to_field() - old_node_hash
-
-        elif isinstance(current_node, InnerNode):
-            # Here the index is not in the current node, so we can simply add a suffix tree here
-            values = {suffix: VerkleValue(value)}
-            suffix_tree = SuffixTree(stem, values)
-
-            suffix_tree.compute_commitment(self._commit_sparse)
-            last_child_node_value_change = suffix_tree.commitment_to_field()
-            current_node[index] = suffix_tree
+        # Case 1) The child at this index is empty, so we can simply add a suffix tree here
+        if not node.contains_index(index):
+            suffix_tree = SuffixTree(stem, {suffix: VerkleValue(value)})
+            node[index] = suffix_tree
+            self._record(updates, suffix_tree, depth + 1, True)
+            return
+
+        # Case 2) The stem matches the suffix tree that we have come across
+        suffix_tree = node[index]
+        if suffix_tree.stem == stem:
+            self._record_value_change(
+                updates, suffix_tree, depth + 1, suffix)
+            suffix_tree[suffix] = VerkleValue(value)
+            return
+
+        # Case 3) The stems do not match, so we replace the old suffix tree with
+        # an intermediate inner node for each index that the stems share after this point.
+        # Both suffix trees are then added to the last intermediate inner node
+        while True:
+            depth += 1
+            intermediate_node = InnerNode.empty()
+            node[index] = intermediate_node
+            self._record(updates, intermediate_node, depth, True)
+            node = intermediate_node
+
+            index = stem[depth]
+            if suffix_tree.stem[depth] != index:
+                break
 
+        node[suffix_tree.stem[depth]] = suffix_tree
+        # The old suffix tree may already have changes pending from this batch
+        if id(suffix_tree) in updates:
+            updates[id(suffix_tree)].depth = depth + 1
+
+        new_suffix_tree = SuffixTree(stem, {suffix: VerkleValue(value)})
+        node[index] = new_suffix_tree
+        self._record(updates, new_suffix_tree, depth + 1, True)
+
+    # Returns the pending update for `node`, creating it if it does not exist
+    def _record(self, updates: Dict[int, NodeUpdate], node, depth: int, is_new=False) -> NodeUpdate:
+        update = updates.get(id(node))
+        if update is None:
+            update = NodeUpdate(node, depth, is_new)
+            updates[id(node)] = update
+        return update
+
+    # Records the hash of the child at `index` before it is first changed in this batch
+    def _record_child_change(self, updates: Dict[int, NodeUpdate], node: InnerNode, depth: int, index: int):
+        update = self._record(updates, node, depth)
+        if update.is_new or index in update.old:
+            return
+        if node.contains_index(index):
+            update.old[index] = node[index].commitment_to_field()
         else:
-            raise Exception("Unknown node type. This is a bug.")
-
-        # Now We should have a list of path elements (child_index, parent_node_hash_old, parent_node)
-        # We iterate from the bottom of the path to the root_node, computing the difference in commitment value
-        # for the parent, based on the change in the child's value
-        for index, old_node_hash, node in reversed(path):
-
-            # Compute the change in this nodes commitment according to the
-            # change in its child at index `index`
-            comm_delta = self.crs[index] * last_child_node_value_change
-            node.commitment().add_point(comm_delta)
-
-            # Compute the new node_hash
-            new_node_hash = node.commitment_to_field()
-            last_child_node_value_change = new_node_hash - old_node_hash
+            update.old[index] = Fr.zero()
+
+    # Records the value at `suffix` before it is first changed in this batch
+    def _record_value_change(self, updates: Dict[int, NodeUpdate], suffix_tree: SuffixTree, depth: int, suffix: int):
+        update = self._record(updates, suffix_tree, depth)
+        if update.is_new or suffix in update.old:
+            return
+        if suffix_tree.contains_index(suffix):
+            update.old[suffix] = suffix_tree[suffix]
+        else:
+            update.old[suffix] = VerkleValue()
+
+    # Updates the commitments of the recorded nodes, from the deepest level to the root.
+    # New nodes have their commitment computed from scratch, while the commitments of
+    # existing nodes are updated using the change in their children
+    def _update_commitments(self, updates: Dict[int, NodeUpdate]):
+        levels = {}
+        for update in updates.values():
+            levels.setdefault(update.depth, []).append(update)
+
+        for depth in sorted(levels.keys(), reverse=True):
+            level = levels[depth]
+            suffix_updates = [
+                update for update in level if isinstance(update.node, SuffixTree)]
+            inner_updates = [
+                update for update in level if isinstance(update.node, InnerNode)]
+
+            new_suffix_trees = [
+                update.node for update in suffix_updates if update.is_new]
+            changed_suffix_trees = [
+                update for update in suffix_updates if not update.is_new]
+
+            old_c_fields = [update.node.update_c1_c2(update.old, self.crs)
+                            for update in changed_suffix_trees]
+            for suffix_tree in new_suffix_trees:
+                suffix_tree.compute_c1_c2(self._commit_sparse)
+
+            VerkleCommitment.batch_commitment_to_field(
+                [C for update in suffix_updates for C in [update.node.C1, update.node.C2]])
+
+            for suffix_tree in new_suffix_trees:
+                suffix_tree.compute_extension_commitment(self._commit_sparse)
+            for update, (old_c1_field, old_c2_field) in zip(changed_suffix_trees, old_c_fields):
+                update.node.update_extension_commitment(
+                    old_c1_field, old_c2_field, self.crs)
+
+            # The children are one level deeper, so they have already been updated
+            changed_children = []
+            for update in inner_updates:
+                indices = update.node.children.keys() if update.is_new else update.old.keys()
+                changed_children += [update.node[index] for index in indices]
+            VerkleCommitment.batch_commitment_to_field(
+                [child.node_commitment for child in changed_children])
+
+            for update in inner_updates:
+                if update.is_new:
+                    update.node.commit_to_children(self._commit_sparse)
+                else:
+                    update.node.update_children(update.old, self.crs)
 
     def _commit_sparse(self, values: Dict[int, Fr]) -> VerkleCommitment:
         return VerkleCommitment(self.crs.commit_sparse(values))
 
-    def insert_batch(self, keys: List[bytes32], values: List[bytes32]):
-        # TODO: Initially just make this call the insert method multiple times
-        # It can be optimised by inserting the values first and then computing commitments after
-        # For an empty tree its quite simple. For non-empty trees, we need to have a flag for which nodes have changed
-        for key, value in zip(keys, values):
-            self.insert(key, value)
-
     def create_proof(self, keys: List[bytes32]):
         pass
 
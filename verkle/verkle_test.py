@@ -191,6 +191,39 @@ class TestVerkle(unittest.TestCase):
             got_root_hex = got_roots[i]
             self.assertEqual(expected[i], got_root_hex)
 
+    def test_insert_batch(self):
+        """
+        Test that inserting keys in a batch gives the same root as inserting them one at a time
+        """
+        seed = int(0).to_bytes(32, "little")
+        prng = BasicPRNG(seed)
+        keys = prng.rand_vec_bytes(100)
+
+        trie = VerkleTrie(CRS.default())
+        trie.insert_batch(keys, keys)
+        self.assertEqual("afb01df826bd42ddea9001551980f7cfa74f0ca7e0ba36a9079dea4062848600",
+                         trie.root_node.commitment_to_field().to_bytes().hex())
+
+        # Update existing values, add new suffixes to existing stems and add keys which
+        # share a path with an existing stem
+        new_keys = []
+        new_values = []
+        for key in keys[:20]:
+            new_keys += [key, key[:31] + bytes([key[31] ^ 0x80]),
+                         key[:30] + bytes([key[30] ^ 1, key[31]])]
+            new_values += [bytes(32), key, key]
+        trie.insert_batch(new_keys, new_values)
+        root = trie.root()
+
+        sequential_trie = VerkleTrie(CRS.default())
+        for key, value in zip(keys + new_keys, keys + new_values):
+            sequential_trie.insert(key, value)
+        self.assertEqual(root, sequential_trie.root())
+
+        # Recomputing every commitment from scratch gives the same root
+        trie.root_node.compute_commitment(trie._commit_sparse)
+        self.assertEqual(root, trie.root())
+
     def test_splitting_value_smoke(self):
         """
         Test zero and None are split differently